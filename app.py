@@ -19,6 +19,7 @@ from src.exchanges import get_exchange
 from src.strategies import EMACrossStrategy
 from src.strategies.ema_cross import SimpleEMACrossStrategy
 from src.backtest import BacktestEngine
+from src.indicators import indicator_cache
 
 # 페이지 설정
 st.set_page_config(
@@ -69,9 +70,13 @@ def load_data(symbol: str, interval: str, days: int):
     return exchange.get_ohlcv_sync(symbol, interval=interval, limit=days)
 
 
-# 백테스트 실행
-def run_backtest(df, short_period, long_period, trend_period, rsi_threshold,
-                 use_trend_filter, use_rsi_filter, fee_rate, slippage):
+# 백테스트 실행 (캐싱)
+# df 전체는 해싱하지 않고(_df), 조회 조건과 데이터 지문(data_key)으로 캐시 키 구성
+# (파라미터별 캐시 항목의 생성 시각이 달라, 새로 로딩된 df와 이전 결과가 섞이지 않도록)
+@st.cache_data(ttl=300, max_entries=128, show_spinner=False)
+def run_backtest(symbol, interval, days, data_key, _df, short_period, long_period, trend_period,
+                 rsi_threshold, use_trend_filter, use_rsi_filter, fee_rate, slippage):
+    df = _df
     engine = BacktestEngine(fee_rate=fee_rate, slippage=slippage)
 
     # 필터 적용 전략
@@ -90,8 +95,10 @@ def run_backtest(df, short_period, long_period, trend_period, rsi_threshold,
         long_period=long_period,
     )
 
-    result = engine.run(df, strategy)
-    simple_result = engine.run(df, simple_strategy)
+    # 두 전략의 단기/장기 EMA가 같으므로 지표 캐시로 한 번만 계산
+    with indicator_cache():
+        result = engine.run(df, strategy)
+        simple_result = engine.run(df, simple_strategy)
 
     return result, simple_result
 
@@ -101,10 +108,13 @@ with st.spinner("데이터 로딩 중..."):
     df = load_data(symbol, interval, days)
 
 if df is not None and len(df) > 0:
+    # 데이터 지문: 봉 개수, 마지막 봉 시각, 마지막 종가 (진행 중인 봉의 갱신 포함)
+    data_key = (len(df), str(df.index[-1]), float(df["close"].iloc[-1]))
+
     # 백테스트 실행
     result, simple_result = run_backtest(
-        df, short_period, long_period, trend_period, rsi_threshold,
-        use_trend_filter, use_rsi_filter, fee_rate, slippage
+        symbol, interval, days, data_key, df, short_period, long_period, trend_period,
+        rsi_threshold, use_trend_filter, use_rsi_filter, fee_rate, slippage
     )
 
     # 상단 지표 카드
@@ -22,6 +22,15 @@ from src.strategies import EMACrossStrategy
 from src.strategies.ema_cross import SimpleEMACrossStrategy
 
 
+def load_ohlcv(args):
+    """OHLCV 조회 (기본: 디스크 캐시 사용, 그리드 서치/Walk-Forward 반복 실행 시 재조회 생략)"""
+    exchange = get_exchange("upbit")
+
+    if args.no_cache:
+        return exchange.get_ohlcv_sync(args.symbol, interval=args.interval, limit=args.days)
+    return exchange.get_ohlcv_cached(args.symbol, interval=args.interval, limit=args.days)
+
+
 def run_single_backtest(args):
     """단일 전략 백테스트"""
     print(f"\n{'='*60}")
@@ -29,8 +38,7 @@ def run_single_backtest(args):
     print(f"{'='*60}")
 
     # 거래소에서 데이터 조회
-    exchange = get_exchange("upbit")
-    df = exchange.get_ohlcv_sync(args.symbol, interval=args.interval, limit=args.days)
+    df = load_ohlcv(args)
 
     print(f"데이터 기간: {df.index[0].date()} ~ {df.index[-1].date()} ({len(df)}일)")
 
@@ -77,8 +85,7 @@ def run_grid_search(args):
     print(f"그리드 서치: {args.symbol}")
     print(f"{'='*60}")
 
-    exchange = get_exchange("upbit")
-    df = exchange.get_ohlcv_sync(args.symbol, interval=args.interval, limit=args.days)
+    df = load_ohlcv(args)
 
     print(f"데이터 기간: {df.index[0].date()} ~ {df.index[-1].date()} ({len(df)}일)")
 
@@ -93,7 +100,7 @@ def run_grid_search(args):
 
     print(f"\n파라미터 조합: {len(list(param_grid.values())[0]) * len(list(param_grid.values())[1]) * len(list(param_grid.values())[2])}개")
 
-    results = engine.grid_search(df, EMACrossStrategy, param_grid)
+    results = engine.grid_search(df, EMACrossStrategy, param_grid, n_jobs=args.jobs)
 
     print(f"\n{'='*60}")
     print("상위 10개 결과")
@@ -115,8 +122,7 @@ def run_walk_forward(args):
     print(f"Walk-Forward 테스트: {args.symbol}")
     print(f"{'='*60}")
 
-    exchange = get_exchange("upbit")
-    df = exchange.get_ohlcv_sync(args.symbol, interval=args.interval, limit=args.days)
+    df = load_ohlcv(args)
 
     print(f"데이터 기간: {df.index[0].date()} ~ {df.index[-1].date()} ({len(df)}일)")
 
@@ -133,6 +139,7 @@ def run_walk_forward(args):
         EMACrossStrategy,
         param_grid,
         train_ratio=args.train_ratio,
+        n_jobs=args.jobs,
     )
 
     print(f"\n{'='*60}")
@@ -165,6 +172,10 @@ def main():
     parser.add_argument("--grid-search", action="store_true", help="그리드 서치 실행")
     parser.add_argument("--walk-forward", action="store_true", help="Walk-Forward 테스트")
     parser.add_argument("--train-ratio", type=float, default=0.5, help="훈련 비율 (기본: 0.5)")
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="그리드 서치 병렬 프로세스 수 (-1: 모든 코어)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="OHLCV 디스크 캐시 사용 안 함")
 
     args = parser.parse_args()
 
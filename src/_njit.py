@@ -0,0 +1,28 @@
+"""Numba 선택적 의존성 래퍼
+
+numba가 설치되어 있으면 (`pip install -e ".[perf]"`) JIT 컴파일하고,
+없으면 데코레이트된 함수를 그대로 반환합니다.
+"""
+
+try:
+    from numba import njit as _numba_njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    _numba_njit = None
+    NUMBA_AVAILABLE = False
+
+
+def njit(*args, **kwargs):
+    """numba.njit 대체 데코레이터 (numba 미설치 시 no-op)"""
+    if NUMBA_AVAILABLE:
+        return _numba_njit(*args, **kwargs)
+
+    # @njit 형태로 바로 적용된 경우
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    return lambda func: func
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit"]
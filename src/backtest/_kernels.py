@@ -0,0 +1,153 @@
+"""백테스트 수치 커널 (numba JIT)
+
+pandas 연산 체인을 배열 위의 단일 루프로 합친 함수들입니다.
+numba가 없으면 호출 측의 pandas/NumPy 경로를 사용합니다.
+"""
+
+import numpy as np
+
+from src._njit import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True, nogil=True)
+def simulate(
+    close: np.ndarray, signals: np.ndarray, total_cost: float, initial_capital: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    전략 수익률과 자산 곡선 (한 번의 순회)
+
+    수익률[i] = (가격 수익률[i] * 신호[i-1]) - (|신호[i] - 신호[i-1]| * 거래 비용)
+    (포지션 변화가 NaN이면 비용 0, 수익률이 NaN이면 0)
+
+    Args:
+        close: 종가 배열 (float64, 또는 대역폭을 줄이려면 float32)
+        signals: 신호 배열 (정수 신호는 int8, 그 외 float64)
+        total_cost: 수수료 + 슬리피지
+        initial_capital: 초기 자본금
+
+    Returns:
+        (전략 수익률 배열 (첫 값은 0), 자산 곡선 배열) - 입력 dtype과 무관하게 float64
+    """
+    n = close.shape[0]
+    returns = np.zeros(n)
+    equity = np.empty(n)
+    growth = 1.0
+
+    if n > 0:
+        equity[0] = initial_capital
+
+    for i in range(1, n):
+        r = (close[i] / close[i - 1] - 1.0) * signals[i - 1]
+        # 포지션이 바뀐 봉만 비용 차감 (정수 신호면 차이 계산도 정수 연산)
+        # 신호가 NaN이라 변화량이 NaN이면 pandas 경로의 diff().fillna(0)처럼 비용 없음
+        change = signals[i] - signals[i - 1]
+        if change != 0 and change == change:
+            r -= abs(change) * total_cost
+        # pandas 경로의 fillna(0)과 동일하게 NaN은 0으로
+        if r == r:
+            returns[i] = r
+            growth *= 1.0 + r
+        equity[i] = initial_capital * growth
+
+    return returns, equity
+
+
+@njit(cache=True, nogil=True)
+def return_stats(returns: np.ndarray) -> tuple[float, float]:
+    """
+    총 수익률과 표준편차 (한 번의 순회)
+
+    표준편차는 Welford 방식으로 누적해 평균을 다시 계산하지 않습니다.
+
+    Args:
+        returns: 수익률 배열 (NaN 없음)
+
+    Returns:
+        (총 수익률, 표본 표준편차 (ddof=1))
+    """
+    n = returns.shape[0]
+    growth = 1.0
+    mean = 0.0
+    m2 = 0.0
+
+    for i in range(n):
+        r = returns[i]
+        growth *= 1.0 + r
+        delta = r - mean
+        mean += delta / (i + 1)
+        m2 += delta * (r - mean)
+
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else 0.0
+    return growth - 1.0, std
+
+
+@njit(cache=True, nogil=True)
+def max_drawdown(equity: np.ndarray) -> float:
+    """
+    최대 낙폭 (한 번의 순회, 중간 배열 없음)
+
+    Args:
+        equity: 자산 곡선 배열
+
+    Returns:
+        최대 낙폭 (0 이하)
+    """
+    peak = equity[0]
+    mdd = 0.0
+
+    for i in range(equity.shape[0]):
+        value = equity[i]
+        if value > peak:
+            peak = value
+        drawdown = (value - peak) / peak
+        if drawdown < mdd:
+            mdd = drawdown
+
+    return mdd
+
+
+@njit(cache=True, nogil=True)
+def trade_stats(returns: np.ndarray) -> tuple[int, int, float, float]:
+    """
+    승/패 통계 (한 번의 순회, 마스크 배열 없음)
+
+    Args:
+        returns: 수익률 배열 (NaN 없음)
+
+    Returns:
+        (수익 일수, 손실 일수, 수익 합계, 손실 합계 절댓값)
+    """
+    wins = 0
+    losses = 0
+    gains_sum = 0.0
+    losses_sum = 0.0
+
+    for i in range(returns.shape[0]):
+        r = returns[i]
+        if r > 0:
+            wins += 1
+            gains_sum += r
+        elif r < 0:
+            losses += 1
+            losses_sum -= r
+
+    return wins, losses, gains_sum, losses_sum
+
+
+def warmup() -> None:
+    """모든 커널을 더미 배열로 한 번씩 호출해 컴파일 (첫 백테스트 지연 제거)"""
+    # 엔진 호출과 같은 타입으로 컴파일 (pandas가 돌려주는 종가/신호 배열은 읽기 전용)
+    close = np.ones(2)
+    close.flags.writeable = False
+    signals = np.zeros(2, dtype=np.int8)
+    signals.flags.writeable = False
+
+    returns, equity = simulate(close, signals, 0.0, 1.0)
+    return_stats(returns)
+    max_drawdown(equity)
+    trade_stats(returns)
+
+
+# 임포트 시점에 컴파일 (cache=True이므로 두 번째 실행부터는 디스크 캐시 로드)
+if NUMBA_AVAILABLE:
+    warmup()
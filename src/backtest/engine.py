@@ -1,16 +1,26 @@
 """백테스트 엔진"""
 
-from dataclasses import dataclass, field
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields
 from itertools import product
 from typing import Type
 
 import numpy as np
 import pandas as pd
 
-from src.strategies.base import BaseStrategy
+from src._njit import NUMBA_AVAILABLE
+from src.indicators import indicator_cache
+from src.strategies.base import BaseStrategy, IndicatorStrategy
 
+from . import _kernels
 from .metrics import BacktestMetrics, calculate_hodl_return, calculate_metrics
 
+# BacktestEngine이 보관하는 walk_forward 훈련 결과 최대 개수
+_TRAIN_CACHE_SIZE = 32
+
 
 @dataclass
 class BacktestResult:
@@ -53,17 +63,30 @@ class BacktestEngine:
         fee_rate: float = 0.001,
         slippage: float = 0.001,
         initial_capital: float = 10_000_000,
+        price_dtype: type = np.float64,
     ):
         """
         Args:
             fee_rate: 거래 수수료율 (기본 0.1%)
             slippage: 슬리피지 (기본 0.1%)
             initial_capital: 초기 자본금
+            price_dtype: 종가 배열 dtype (np.float32로 주면 긴 시계열에서 메모리 대역폭을
+                절반으로 줄임. 수익률/자산 곡선은 항상 float64로 누적)
         """
         self.fee_rate = fee_rate
         self.slippage = slippage
         self.total_cost = fee_rate + slippage
         self.initial_capital = initial_capital
+        self.price_dtype = price_dtype
+
+        # walk_forward 훈련 구간 그리드 서치 결과 캐시 (최근 사용 순, 최대 _TRAIN_CACHE_SIZE개)
+        self._train_cache: OrderedDict[tuple, pd.DataFrame] = OrderedDict()
+
+    def __getstate__(self) -> dict:
+        # 병렬 워커로 보낼 때 훈련 결과 캐시는 제외 (워커는 쓰지 않음)
+        state = self.__dict__.copy()
+        state["_train_cache"] = OrderedDict()
+        return state
 
     def run(self, df: pd.DataFrame, strategy: BaseStrategy) -> BacktestResult:
         """
@@ -76,36 +99,80 @@ class BacktestEngine:
         Returns:
             BacktestResult 객체
         """
-        # 전략 계산
-        result_df = strategy.calculate(df)
+        close = df["close"].to_numpy(dtype=self.price_dtype)
+        return self._run_with_precomputed(df, strategy, close, calculate_hodl_return(close))
 
-        # 벡터화 수익률 계산
-        returns = result_df["close"].pct_change()
-        signals = result_df["signal"]
-
-        # 포지션 변화 (거래 발생)
-        position_changes = signals.diff().fillna(0).abs()
-
-        # 전략 수익률 = (가격 수익률 * 이전 신호) - 거래 비용
-        strategy_returns = (returns * signals.shift(1)) - (position_changes * self.total_cost)
-        strategy_returns = strategy_returns.fillna(0)
+    def _run_with_precomputed(
+        self,
+        df: pd.DataFrame,
+        strategy: BaseStrategy,
+        close: np.ndarray,
+        hodl_return: float,
+        indicators: dict[str, np.ndarray] | None = None,
+    ) -> BacktestResult:
+        """
+        전략과 무관한 값(종가 배열, HODL 수익률)을 받아 백테스트 실행
 
-        # 자산 곡선
-        equity_curve = self.initial_capital * (1 + strategy_returns).cumprod()
+        그리드 서치처럼 같은 df로 여러 번 실행할 때 조합마다 다시 계산하지 않도록 분리.
+        indicators를 주면 지표 계산을 건너뛰고 신호만 생성합니다.
+        """
+        # 전략 계산
+        if indicators is None:
+            result_df = strategy.calculate(df)
+        else:
+            result_df = strategy.calculate_from(df, indicators)
+
+        # 이후 계산은 모두 NumPy 배열로 (중간 Series 생성 없음)
+        signals = result_df["signal"].to_numpy()
+
+        if NUMBA_AVAILABLE:
+            # 수익률/포지션 변화/비용/자산 곡선을 JIT 커널 한 번의 순회로 계산
+            # 정수 신호(int8 등)는 그대로 넘겨 포지션 변화를 정수 연산으로 처리
+            if np.issubdtype(signals.dtype, np.integer):
+                sig = signals
+            else:
+                sig = signals.astype(np.float64, copy=False)
+
+            strategy_returns, equity_curve = _kernels.simulate(
+                close, sig, self.total_cost, float(self.initial_capital)
+            )
+        else:
+            sig = signals.astype(np.float64)
+
+            # 전략 수익률 = (가격 수익률 * 이전 신호) - (포지션 변화 * 거래 비용)
+            # 시프트는 슬라이스 뷰로, 나머지는 결과 배열에 제자리 연산으로 처리
+            strategy_returns = np.empty(len(close))
+            strategy_returns[:1] = 0
+            tail = strategy_returns[1:]
+
+            np.divide(close[1:], close[:-1], out=tail)
+            tail -= 1.0
+            tail *= sig[:-1]
+
+            position_changes = np.subtract(sig[1:], sig[:-1])
+            np.abs(position_changes, out=position_changes)
+            # NaN 신호로 생긴 NaN 변화량은 비용 없음 (diff().fillna(0)과 동일)
+            position_changes[np.isnan(position_changes)] = 0
+            position_changes *= self.total_cost
+            tail -= position_changes
+
+            strategy_returns[np.isnan(strategy_returns)] = 0
+
+            # 자산 곡선
+            equity_curve = np.add(strategy_returns, 1.0)
+            np.cumprod(equity_curve, out=equity_curve)
+            equity_curve *= self.initial_capital
 
         # 성과 지표 계산
         metrics = calculate_metrics(strategy_returns, equity_curve, signals)
 
-        # HODL 수익률
-        hodl_return = calculate_hodl_return(df)
-
         return BacktestResult(
             strategy_name=strategy.name,
             params=strategy.params,
             metrics=metrics,
             hodl_return=hodl_return,
-            equity_curve=equity_curve.values,
-            signals=signals.values,
+            equity_curve=equity_curve,
+            signals=signals,
             df=result_df,
         )
 
@@ -115,6 +182,7 @@ class BacktestEngine:
         strategy_class: Type[BaseStrategy],
         param_grid: dict,
         sort_by: str = "sharpe_ratio",
+        n_jobs: int = 1,
     ) -> pd.DataFrame:
         """
         파라미터 그리드 서치
@@ -124,29 +192,41 @@ class BacktestEngine:
             strategy_class: 전략 클래스
             param_grid: 파라미터 그리드 {"param_name": [값들]}
             sort_by: 정렬 기준 지표
+            n_jobs: 병렬 프로세스 수 (1: 순차 실행, 음수: 모든 코어, 0은 허용 안 함)
 
         Returns:
             결과 DataFrame (정렬됨)
         """
-        results = []
-        param_names = list(param_grid.keys())
-        param_values = list(param_grid.values())
+        if n_jobs == 0:
+            raise ValueError("n_jobs must be non-zero (1: serial, -1: all cores)")
+
+        # 조합은 값 튜플로만 보관 (조합별 dict는 전략 생성 시점에만 만듦)
+        param_names = tuple(param_grid.keys())
+        param_rows = list(product(*param_grid.values()))
+
+        # 결과는 고정 스키마의 구조화 배열에 바로 기록 (dict 리스트 생성 없음)
+        dtype = _summary_dtype(strategy_class, param_grid)
+        if dtype is None:
+            return pd.DataFrame()
 
-        for values in product(*param_values):
-            params = dict(zip(param_names, values))
+        if n_jobs != 1:
+            results = self._grid_search_parallel(
+                df, strategy_class, param_names, param_rows, dtype, n_jobs
+            )
+        else:
+            # 조합과 무관한 값은 루프 밖에서 한 번만 계산
+            close = df["close"].to_numpy(dtype=self.price_dtype)
+            hodl_return = calculate_hodl_return(close)
 
-            try:
-                strategy = strategy_class(**params)
-                result = self.run(df, strategy)
-                results.append(result.summary())
-            except Exception as e:
-                print(f"Error with params {params}: {e}")
-                continue
+            results = self._run_combos(
+                df, strategy_class, param_names, param_rows, close, hodl_return, dtype
+            )
 
-        if not results:
+        if len(results) == 0:
             return pd.DataFrame()
 
-        results_df = pd.DataFrame(results)
+        # 파라미터 컬럼(object)은 기록된 실제 값으로 타입 추론 (int/float/bool)
+        results_df = pd.DataFrame.from_records(results).infer_objects()
 
         # 정렬
         if sort_by in results_df.columns:
@@ -154,12 +234,112 @@ class BacktestEngine:
 
         return results_df.reset_index(drop=True)
 
+    def _run_combos(
+        self,
+        df: pd.DataFrame,
+        strategy_class: Type[BaseStrategy],
+        param_names: tuple[str, ...],
+        param_rows: list[tuple],
+        close: np.ndarray,
+        hodl_return: float,
+        dtype: np.dtype,
+    ) -> np.ndarray:
+        """
+        파라미터 조합 순차 실행
+
+        지표 파라미터(indicator_key)가 같은 조합끼리는 지표를 한 번만 계산하고
+        신호 생성만 반복합니다 (예: rsi_threshold만 다른 조합).
+
+        Returns:
+            성공한 조합의 결과 구조화 배열 (입력 순서 유지)
+        """
+        records = np.empty(len(param_rows), dtype=dtype)
+        ok = np.zeros(len(param_rows), dtype=bool)
+        indicator_sets: dict[tuple, dict[str, np.ndarray]] = {}
+
+        # 같은 기간의 지표(EMA, RSI 등)는 조합 간에 한 번만 계산
+        with indicator_cache():
+            for i, values in enumerate(param_rows):
+                try:
+                    # 그리드 순서가 __init__ 인자 순서와 다를 수 있어 키워드 인자로 생성
+                    strategy = strategy_class(**dict(zip(param_names, values)))
+
+                    # 두 단계로 나뉜 전략만 지표 공유 (그 외는 calculate 직접 호출)
+                    indicators = None
+                    key = (
+                        strategy.indicator_key if isinstance(strategy, IndicatorStrategy) else None
+                    )
+                    if key is not None:
+                        indicators = indicator_sets.get(key)
+                        if indicators is None:
+                            indicators = strategy.compute_indicators(df)
+                            indicator_sets[key] = indicators
+
+                    result = self._run_with_precomputed(
+                        df, strategy, close, hodl_return, indicators
+                    )
+                    # summary() dict를 거치지 않고 스키마 순서대로 바로 기록
+                    records[i] = (
+                        result.strategy_name,
+                        *result.params.values(),
+                        *result.metrics.to_dict().values(),
+                        result.hodl_return,
+                    )
+                    ok[i] = True
+                except Exception as e:
+                    print(f"Error with params {dict(zip(param_names, values))}: {e}")
+
+        return records[ok]
+
+    def _grid_search_parallel(
+        self,
+        df: pd.DataFrame,
+        strategy_class: Type[BaseStrategy],
+        param_names: tuple[str, ...],
+        param_rows: list[tuple],
+        dtype: np.dtype,
+        n_jobs: int,
+    ) -> np.ndarray:
+        """
+        프로세스 풀로 파라미터 조합 실행 (결과는 입력 순서 유지)
+
+        조합을 연속된 묶음으로 나눠 전달해 작업당 피클링 비용을 줄이고,
+        워커 안에서 묶음 단위로 지표를 공유합니다.
+        """
+        max_workers = os.cpu_count() if n_jobs < 0 else n_jobs
+
+        # 워커당 4개 정도의 묶음 (부하 분산과 캐시 재사용의 절충)
+        chunk_size = max(1, -(-len(param_rows) // (max_workers * 4)))
+        chunks = [param_rows[i : i + chunk_size] for i in range(0, len(param_rows), chunk_size)]
+        records: list[np.ndarray] = [np.empty(0, dtype=dtype) for _ in chunks]
+
+        # df와 엔진 설정은 워커마다 한 번만 전달
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(df, self),
+        ) as executor:
+            futures = {
+                executor.submit(_run_trials, strategy_class, param_names, chunk, dtype): i
+                for i, chunk in enumerate(chunks)
+            }
+
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    records[i] = future.result()
+                except Exception as e:
+                    print(f"Error with params {chunks[i]}: {e}")
+
+        return np.concatenate(records)
+
     def walk_forward(
         self,
         df: pd.DataFrame,
         strategy_class: Type[BaseStrategy],
         param_grid: dict,
         train_ratio: float = 0.5,
+        n_jobs: int = 1,
     ) -> dict:
         """
         Walk-Forward 테스트
@@ -172,16 +352,32 @@ class BacktestEngine:
             strategy_class: 전략 클래스
             param_grid: 파라미터 그리드
             train_ratio: 훈련 기간 비율 (기본 50%)
+            n_jobs: 훈련 기간 그리드 서치 병렬 프로세스 수
 
         Returns:
             {"train_result": ..., "test_result": ..., "best_params": ...}
         """
+        # 전략은 입력 df를 수정하지 않으므로 복사 없이 슬라이스 사용
         split_idx = int(len(df) * train_ratio)
-        train_df = df.iloc[:split_idx].copy()
-        test_df = df.iloc[split_idx:].copy()
-
-        # 훈련 기간 최적화
-        train_results = self.grid_search(train_df, strategy_class, param_grid)
+        train_df = df.iloc[:split_idx]
+        test_df = df.iloc[split_idx:]
+
+        # 훈련 기간 최적화 (같은 데이터/그리드/비용/종가 dtype이면 이전 결과 재사용)
+        cache_key = (
+            hashlib.sha1(pd.util.hash_pandas_object(train_df).to_numpy().tobytes()).hexdigest(),
+            strategy_class,
+            tuple((name, tuple(values)) for name, values in param_grid.items()),
+            self.total_cost,
+            np.dtype(self.price_dtype),
+        )
+        train_results = self._train_cache.get(cache_key)
+        if train_results is None:
+            train_results = self.grid_search(train_df, strategy_class, param_grid, n_jobs=n_jobs)
+            self._train_cache[cache_key] = train_results
+            if len(self._train_cache) > _TRAIN_CACHE_SIZE:
+                self._train_cache.popitem(last=False)
+        else:
+            self._train_cache.move_to_end(cache_key)
 
         if len(train_results) == 0:
             return {"error": "No valid results in training period"}
@@ -207,6 +403,43 @@ class BacktestEngine:
             "test_result": test_result,
         }
 
+    def run_multi(
+        self,
+        dfs: dict[str, pd.DataFrame],
+        strategy: BaseStrategy,
+        max_workers: int | None = None,
+    ) -> dict[str, BacktestResult]:
+        """
+        여러 심볼에 같은 전략 실행 (스레드 병렬)
+
+        JIT 커널은 GIL을 풀고 실행되므로 프로세스 풀과 달리 데이터 피클링 없이
+        심볼별 계산이 겹쳐 실행됩니다 (numba 미설치 시에는 NumPy 연산 구간만 겹침).
+
+        Args:
+            dfs: {심볼: OHLCV DataFrame}
+            strategy: 전략 인스턴스 (심볼 간 공유, 상태를 바꾸지 않음)
+            max_workers: 스레드 수 (None: 모든 코어)
+
+        Returns:
+            {심볼: BacktestResult} (실패한 심볼은 제외)
+        """
+        results: dict[str, BacktestResult] = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = {
+                executor.submit(self.run, df, strategy): symbol for symbol, df in dfs.items()
+            }
+
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    results[symbol] = future.result()
+                except Exception as e:
+                    print(f"Error with {symbol}: {e}")
+
+        # 입력 순서 유지
+        return {symbol: results[symbol] for symbol in dfs if symbol in results}
+
     def compare_strategies(
         self,
         df: pd.DataFrame,
@@ -224,11 +457,75 @@ class BacktestEngine:
         """
         results = []
 
-        for strategy in strategies:
-            try:
-                result = self.run(df, strategy)
-                results.append(result.summary())
-            except Exception as e:
-                print(f"Error with {strategy.name}: {e}")
+        # 전략 간 겹치는 지표(같은 기간의 EMA 등)는 한 번만 계산
+        with indicator_cache():
+            for strategy in strategies:
+                try:
+                    result = self.run(df, strategy)
+                    results.append(result.summary())
+                except Exception as e:
+                    print(f"Error with {strategy.name}: {e}")
 
         return pd.DataFrame(results)
+
+
+# ===== 병렬 그리드 서치 워커 =====
+
+_worker_df: pd.DataFrame | None = None
+_worker_engine: BacktestEngine | None = None
+_worker_close: np.ndarray | None = None
+_worker_hodl: float = 0.0
+
+
+def _init_worker(df: pd.DataFrame, engine: BacktestEngine) -> None:
+    """워커 프로세스 초기화 (공유 데이터 및 조합과 무관한 값 보관)"""
+    global _worker_df, _worker_engine, _worker_close, _worker_hodl
+    _worker_df = df
+    _worker_engine = engine
+    _worker_close = df["close"].to_numpy(dtype=engine.price_dtype)
+    _worker_hodl = calculate_hodl_return(_worker_close)
+
+
+def _run_trials(
+    strategy_class: Type[BaseStrategy],
+    param_names: tuple[str, ...],
+    param_rows: list[tuple],
+    dtype: np.dtype,
+) -> np.ndarray:
+    """워커에서 파라미터 조합 묶음 실행 (성공한 조합의 구조화 배열)"""
+    return _worker_engine._run_combos(
+        _worker_df, strategy_class, param_names, param_rows, _worker_close, _worker_hodl, dtype
+    )
+
+
+# ===== 그리드 서치 결과 스키마 =====
+
+
+def _summary_dtype(strategy_class: Type[BaseStrategy], param_grid: dict) -> np.dtype | None:
+    """
+    BacktestResult.summary()와 같은 컬럼 순서의 구조화 배열 dtype
+
+    파라미터 컬럼은 전략 인스턴스의 params 기준입니다. 전략이 보고하는 값의 타입은
+    그리드 값과 다를 수 있으므로 (예: band / 100) object로 그대로 보관하고,
+    결과 DataFrame을 만든 뒤 실제 값으로 타입을 추론합니다. 생성 가능한 조합이 없으면 None.
+    """
+    strategy = None
+    for values in product(*param_grid.values()):
+        try:
+            strategy = strategy_class(**dict(zip(param_grid, values)))
+            break
+        except Exception:
+            continue
+    if strategy is None:
+        return None
+
+    param_fields = [(name, object) for name in strategy.params]
+
+    metric_fields = [
+        (f.name, np.int64 if f.name == "total_trades" else np.float64)
+        for f in fields(BacktestMetrics)
+    ]
+
+    return np.dtype(
+        [("strategy", object), *param_fields, *metric_fields, ("hodl_return", np.float64)]
+    )
@@ -5,6 +5,10 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+from src._njit import NUMBA_AVAILABLE
+
+from . import _kernels
+
 
 @dataclass
 class BacktestMetrics:
@@ -43,22 +47,27 @@ class BacktestMetrics:
 
 
 def calculate_metrics(
-    returns: pd.Series,
+    returns: np.ndarray | pd.Series,
     equity_curve: np.ndarray | pd.Series,
-    signals: pd.Series | None = None,
+    signals: np.ndarray | pd.Series | None = None,
 ) -> BacktestMetrics:
     """
     성과 지표 계산
 
     Args:
-        returns: 전략 수익률 시리즈
+        returns: 전략 수익률 (배열 또는 시리즈)
         equity_curve: 자산 곡선
-        signals: 신호 시리즈 (거래 횟수 계산용)
+        signals: 신호 (거래 횟수 계산용)
 
     Returns:
         BacktestMetrics 객체
     """
-    returns = returns.dropna()
+    returns = np.asarray(returns, dtype=np.float64)
+
+    # 엔진 수익률에는 NaN이 없으므로, 있을 때만 걸러낸 배열을 새로 만듦
+    # (합이 NaN이 아니면 NaN 원소도 없음)
+    if np.isnan(returns.sum()):
+        returns = returns[~np.isnan(returns)]
 
     if len(returns) == 0:
         return BacktestMetrics(
@@ -70,50 +79,67 @@ def calculate_metrics(
             total_trades=0,
         )
 
-    # 총 수익률
-    total_return = (1 + returns).prod() - 1
+    days = len(returns)
+
+    # 총 수익률 / 수익률 표준편차
+    if NUMBA_AVAILABLE:
+        total_return, returns_std = _kernels.return_stats(returns)
+    else:
+        total_return = (1 + returns).prod() - 1
+        returns_std = returns.std(ddof=1) if days > 1 else 0
 
     # 연환산 수익률
-    days = len(returns)
     if days > 0 and total_return > -1:
         annual_return = (1 + total_return) ** (365 / days) - 1
     else:
         annual_return = 0
 
     # 변동성 및 샤프 비율
-    volatility = returns.std() * np.sqrt(365)
+    volatility = returns_std * np.sqrt(365)
     sharpe_ratio = annual_return / volatility if volatility > 0 else 0
 
     # 최대 낙폭 (MDD)
-    if isinstance(equity_curve, pd.Series):
-        equity = equity_curve.values
+    equity = np.asarray(equity_curve, dtype=np.float64)
+
+    if NUMBA_AVAILABLE:
+        max_drawdown = _kernels.max_drawdown(equity)
     else:
-        equity = equity_curve
+        peak = np.maximum.accumulate(equity)
+        drawdown = (equity - peak) / peak
+        max_drawdown = drawdown.min()
 
-    peak = np.maximum.accumulate(equity)
-    drawdown = (equity - peak) / peak
-    max_drawdown = drawdown.min()
+    # 승/패 통계 (한 번의 순회 또는 마스크 한 번씩)
+    if NUMBA_AVAILABLE:
+        wins, losses, total_gains, total_losses = _kernels.trade_stats(returns)
+    else:
+        win_mask = returns > 0
+        loss_mask = returns < 0
+        wins = int(np.count_nonzero(win_mask))
+        losses = int(np.count_nonzero(loss_mask))
+        total_gains = returns.sum(where=win_mask)
+        total_losses = -returns.sum(where=loss_mask)
 
     # 거래 횟수
     if signals is not None:
-        position_changes = signals.diff().fillna(0)
-        total_trades = int((position_changes != 0).sum())
+        position_changes = np.diff(np.asarray(signals))
+        # NaN 신호로 생긴 NaN 변화량은 거래가 아님 (정수 신호는 NaN이 없어 그대로 셈)
+        if np.issubdtype(position_changes.dtype, np.floating):
+            position_changes = position_changes[~np.isnan(position_changes)]
+        total_trades = int(np.count_nonzero(position_changes))
     else:
-        total_trades = int((returns != 0).sum())
+        total_trades = wins + losses
 
     # 승률
-    winning_returns = returns[returns > 0]
-    losing_returns = returns[returns < 0]
-    total_trading_days = len(winning_returns) + len(losing_returns)
-    win_rate = len(winning_returns) / total_trading_days if total_trading_days > 0 else 0
+    total_trading_days = wins + losses
+    win_rate = wins / total_trading_days if total_trading_days > 0 else 0
 
     # 수익 팩터
-    total_gains = winning_returns.sum() if len(winning_returns) > 0 else 0
-    total_losses = abs(losing_returns.sum()) if len(losing_returns) > 0 else 0
     profit_factor = total_gains / total_losses if total_losses > 0 else float("inf")
 
-    # 평균 거래 수익률
-    avg_trade_return = returns[returns != 0].mean() if (returns != 0).any() else 0
+    # 평균 거래 수익률 (0이 아닌 수익률 = 수익 + 손실)
+    avg_trade_return = (
+        (total_gains - total_losses) / total_trading_days if total_trading_days > 0 else 0
+    )
 
     return BacktestMetrics(
         total_return=total_return,
@@ -127,8 +153,9 @@ def calculate_metrics(
     )
 
 
-def calculate_hodl_return(df: pd.DataFrame) -> float:
-    """단순 보유 수익률 계산"""
-    if len(df) < 2:
+def calculate_hodl_return(data: pd.DataFrame | np.ndarray) -> float:
+    """단순 보유 수익률 계산 (OHLCV DataFrame 또는 종가 배열)"""
+    close = data["close"].to_numpy() if isinstance(data, pd.DataFrame) else data
+    if len(close) < 2:
         return 0
-    return (df["close"].iloc[-1] / df["close"].iloc[0]) - 1
+    return float(close[-1]) / float(close[0]) - 1
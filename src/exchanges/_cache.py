@@ -0,0 +1,65 @@
+"""OHLCV 디스크 캐시 (백테스트용)
+
+같은 조건의 데이터를 반복 조회할 때 거래소 API 호출을 건너뛰도록
+(거래소, 심볼, 간격)마다 Parquet 파일 하나로 저장합니다.
+만료된 캐시는 최근 구간만 새로 받아 이어 붙입니다.
+pyarrow가 없으면 캐시 없이 동작합니다.
+"""
+
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "quant-bot" / "ohlcv"
+
+# 이 시간 (초) 이내에 저장한 캐시는 API 호출 없이 사용
+MAX_AGE = 12 * 60 * 60
+
+
+def _cache_path(exchange: str, ticker: str, interval: str) -> Path:
+    return CACHE_DIR / f"{exchange}_{ticker}_{interval}.parquet"
+
+
+def cache_age(exchange: str, ticker: str, interval: str) -> float | None:
+    """마지막 저장 후 경과 시간 (초, 캐시가 없으면 None)"""
+    try:
+        return time.time() - _cache_path(exchange, ticker, interval).stat().st_mtime
+    except OSError:
+        return None
+
+
+def load_cached(exchange: str, ticker: str, interval: str) -> pd.DataFrame | None:
+    """캐시된 OHLCV 조회 (없거나 읽을 수 없으면 None)"""
+    try:
+        return pd.read_parquet(_cache_path(exchange, ticker, interval))
+    except (ImportError, OSError, ValueError):
+        return None
+
+
+def save_cached(df: pd.DataFrame, exchange: str, ticker: str, interval: str) -> None:
+    """OHLCV 캐시 저장 (같은 조건의 기존 파일은 덮어씀)"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(_cache_path(exchange, ticker, interval), compression="zstd")
+    except (ImportError, OSError):
+        # pyarrow 미설치, 쓰기 권한 없음 등: 캐시 없이 진행
+        return
+
+
+def merge_tail(cached: pd.DataFrame, tail: pd.DataFrame) -> pd.DataFrame:
+    """
+    캐시의 tail 시작 이전 구간과 새로 받은 tail을 이어 붙임
+
+    컬럼과 dtype이 같은 OHLCV 프레임이면 pd.concat 대신 값 배열과 인덱스만 이어 붙입니다.
+    """
+    head = cached.index.searchsorted(tail.index[0])
+
+    same_layout = cached.columns.equals(tail.columns) and cached.dtypes.equals(tail.dtypes)
+    if not same_layout or tail.dtypes.nunique() != 1:
+        return pd.concat([cached.iloc[:head], tail])
+
+    values = np.concatenate((cached.to_numpy()[:head], tail.to_numpy()))
+    return pd.DataFrame(values, index=cached.index[:head].append(tail.index), columns=tail.columns)
@@ -1,5 +1,6 @@
 """거래소 기본 인터페이스"""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Literal, Optional
 
@@ -7,6 +8,8 @@ import pandas as pd
 
 from src.models import OrderResult, OrderSide, OrderType
 
+from ._cache import MAX_AGE, cache_age, load_cached, merge_tail, save_cached
+
 
 class BaseExchange(ABC):
     """거래소 추상 기본 클래스"""
@@ -60,6 +63,19 @@ class BaseExchange(ABC):
         """
         pass
 
+    async def get_tickers(self, symbols: list[str]) -> dict[str, float]:
+        """
+        여러 심볼 현재가 일괄 조회 (거래소별로 한 번의 요청으로 오버라이드)
+
+        Returns:
+            {정규화된 심볼: 현재가}
+        """
+        tickers = await asyncio.gather(*(self.get_ticker(symbol) for symbol in symbols))
+        return {
+            self._normalize_symbol(symbol): ticker["price"]
+            for symbol, ticker in zip(symbols, tickers)
+        }
+
     # ===== 동기 버전 (백테스팅용) =====
 
     def get_ohlcv_sync(
@@ -69,11 +85,68 @@ class BaseExchange(ABC):
         limit: int = 200,
     ) -> pd.DataFrame:
         """동기 OHLCV 조회 (백테스팅용)"""
-        import asyncio
+        return asyncio.run(self.get_ohlcv(symbol, interval, limit))
+
+    def get_ohlcv_batch_sync(
+        self,
+        requests: list[tuple[str, str, int]],
+        max_concurrency: int = 4,
+    ) -> list[pd.DataFrame]:
+        """
+        여러 (심볼, 간격, 개수) 조합을 동시에 조회 (멀티 에셋 백테스팅용)
+
+        Args:
+            requests: [(symbol, interval, limit), ...]
+            max_concurrency: 동시에 진행할 최대 요청 수 (API 제한 고려)
+
+        Returns:
+            요청 순서대로의 DataFrame 리스트
+        """
+
+        async def fetch_all() -> list[pd.DataFrame]:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def fetch(symbol: str, interval: str, limit: int) -> pd.DataFrame:
+                async with semaphore:
+                    return await self.get_ohlcv(symbol, interval, limit)
+
+            return await asyncio.gather(*(fetch(*request) for request in requests))
 
-        return asyncio.get_event_loop().run_until_complete(
-            self.get_ohlcv(symbol, interval, limit)
-        )
+        return asyncio.run(fetch_all())
+
+    def get_ohlcv_cached(
+        self,
+        symbol: str,
+        interval: str = "1d",
+        limit: int = 200,
+    ) -> pd.DataFrame:
+        """
+        디스크 캐시를 거치는 동기 OHLCV 조회 (반복 백테스트용)
+
+        캐시가 limit개 이상이고 12시간 이내면 API 호출 없이 반환합니다.
+        오래된 캐시는 최근 한 페이지만 받아 겹치는 구간부터 교체하고,
+        캐시보다 긴 기간을 요청하면 전체를 다시 받습니다.
+        """
+        key = (self.name, self._normalize_symbol(symbol), self._normalize_interval(interval))
+
+        cached = load_cached(*key)
+        if cached is not None and len(cached) >= limit:
+            age = cache_age(*key)
+            if age is not None and age <= MAX_AGE:
+                return cached.iloc[-limit:]
+
+            # 마지막 봉(미완성일 수 있음)부터 겹치도록 받아 그 이후를 교체
+            tail = self.get_ohlcv_sync(symbol, interval, min(limit, 200))
+            if tail is not None and len(tail) > 0 and tail.index[0] <= cached.index[-1]:
+                df = merge_tail(cached, tail)
+                save_cached(df, *key)
+                return df.iloc[-limit:]
+
+        df = self.get_ohlcv_sync(symbol, interval, limit)
+        if df is not None and len(df) > 0:
+            save_cached(df, *key)
+
+        return df
 
     # ===== 거래 기능 (선택적 구현) =====
 
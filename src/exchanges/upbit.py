@@ -1,22 +1,147 @@
 """업비트 거래소 어댑터"""
 
 import asyncio
+import threading
 import time
+from types import MappingProxyType
 from typing import Literal, Optional
 
+import numpy as np
 import pandas as pd
 import pyupbit
 
-from src.models import OrderResult, OrderSide, OrderStatus, OrderType
+from src.models import CandleArray, OrderResult, OrderSide, OrderStatus, OrderType
 
 from .base import BaseExchange
 
 
-class UpbitExchange(BaseExchange):
-    """업비트 현물 거래소"""
+class _OHLCVBuffer:
+    """
+    페이지 단위 캔들 수집 버퍼
+
+    최신 페이지부터 과거 방향으로 받아오므로, 고정 크기 배열을
+    뒤에서부터 채워 concat/정렬 없이 시간순 DataFrame을 만듭니다.
+    페이지마다 이미 받은 구간과 겹치는 봉을 잘라내므로 중복 제거도 필요 없습니다.
+    """
+
+    def __init__(self, size: int):
+        self._size = size
+        self._start = size
+        self._values: np.ndarray | None = None
+        self._index: np.ndarray | None = None
+        self._columns: pd.Index | None = None
+        self._index_name = None
+
+    def __len__(self) -> int:
+        return self._size - self._start
+
+    def prepend(self, df: pd.DataFrame, limit: int | None = None) -> None:
+        """
+        현재까지 채운 구간보다 과거인 페이지 추가 (겹치는 봉은 기존 최신 값 유지)
+
+        Args:
+            df: 시간순 OHLCV 페이지
+            limit: 겹치는 봉을 잘라낸 뒤 추가할 최대 봉 수 (최근 봉 우선, None: 전부)
+        """
+        if self._values is None:
+            self._values = np.empty((self._size, df.shape[1]), dtype=np.float64)
+            self._index = np.empty(self._size, dtype=df.index.dtype)
+            self._columns = df.columns
+            self._index_name = df.index.name
+        elif len(self):
+            # 페이지는 시간순이므로 가장 오래된 봉보다 앞선 부분만 사용
+            df = df.iloc[: df.index.searchsorted(self.oldest)]
+        if limit is not None:
+            df = df.iloc[len(df) - min(limit, len(df)) :]
+
+        n = len(df)
+        if n > self._start:
+            self._grow(n - self._start)
+
+        start = self._start - n
+        self._values[start : self._start] = df.to_numpy(dtype=np.float64)
+        self._index[start : self._start] = df.index.to_numpy()
+        self._start = start
+
+    @property
+    def oldest(self):
+        """가장 오래된 봉의 시각 (다음 페이지 요청의 to 기준)"""
+        return pd.Timestamp(self._index[self._start])
+
+    def _grow(self, extra: int) -> None:
+        """앞쪽으로 버퍼 확장 (겹친 페이지로 예상보다 많이 받은 경우)"""
+        values = np.empty((self._size + extra, self._values.shape[1]), dtype=np.float64)
+        index = np.empty(self._size + extra, dtype=self._index.dtype)
+        values[extra:] = self._values
+        index[extra:] = self._index
+        self._values, self._index = values, index
+        self._size += extra
+        self._start += extra
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """시간순 DataFrame"""
+        if self._values is None:
+            return pd.DataFrame()
 
-    # 시간 간격 매핑
-    INTERVAL_MAP = {
+        index = pd.DatetimeIndex(self._index[self._start :], name=self._index_name)
+        return pd.DataFrame(self._values[self._start :], index=index, columns=self._columns)
+
+
+class _RateLimiter:
+    """
+    초당 요청 수 제한 (요청 시각을 일정 간격으로 예약)
+
+    동시에 진행 중인 요청 수와 무관하게 rate를 넘지 않도록,
+    호출마다 다음 요청 가능 시각을 예약하고 그때까지 대기합니다.
+    스레드/이벤트 루프 간에 공유해도 안전합니다.
+    """
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """요청 슬롯 예약 후 대기해야 할 시간 (초)"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self._interval
+        return slot - now
+
+    async def wait(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def wait_sync(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+# 업비트 시세 조회 API 제한 (초당 10회, IP 단위라 프로세스 전체에서 공유)
+_QUOTATION_LIMITER = _RateLimiter(10)
+
+
+# 봉 간격 (월봉은 간격이 일정하지 않아 제외)
+_INTERVAL_STEPS = {
+    "minute1": pd.Timedelta(minutes=1),
+    "minute3": pd.Timedelta(minutes=3),
+    "minute5": pd.Timedelta(minutes=5),
+    "minute10": pd.Timedelta(minutes=10),
+    "minute15": pd.Timedelta(minutes=15),
+    "minute30": pd.Timedelta(minutes=30),
+    "minute60": pd.Timedelta(minutes=60),
+    "minute240": pd.Timedelta(minutes=240),
+    "day": pd.Timedelta(days=1),
+    "week": pd.Timedelta(weeks=1),
+}
+
+
+# 시간 간격 -> 업비트 간격 이름
+_INTERVAL_NAMES = MappingProxyType(
+    {
         "1m": "minute1",
         "3m": "minute3",
         "5m": "minute5",
@@ -32,10 +157,30 @@ class UpbitExchange(BaseExchange):
         "minute60": "minute60",
         "day": "day",
     }
+)
+
+
+def _to_ticker(symbol: str) -> str:
+    """심볼 -> 업비트 티커 (BTC, BTC/KRW -> KRW-BTC)"""
+    if "-" in symbol:
+        return symbol
+    if "/" in symbol:
+        base, quote = symbol.split("/")
+        return f"{quote}-{base}"
+    return f"KRW-{symbol}"
+
+
+class UpbitExchange(BaseExchange):
+    """업비트 현물 거래소"""
+
+    # 시간 간격 매핑 (읽기 전용)
+    INTERVAL_MAP = _INTERVAL_NAMES
 
     def __init__(self, api_key: str = "", secret_key: str = ""):
         super().__init__(api_key, secret_key)
         self._upbit: Optional[pyupbit.Upbit] = None
+        # (심볼, 간격) -> (티커, 간격 이름) 정규화 결과
+        self._normalized: dict[tuple[str, Optional[str]], tuple[str, Optional[str]]] = {}
 
         if api_key and secret_key:
             self._upbit = pyupbit.Upbit(api_key, secret_key)
@@ -50,17 +195,29 @@ class UpbitExchange(BaseExchange):
 
     def _normalize_symbol(self, symbol: str) -> str:
         """심볼 정규화: BTC -> KRW-BTC"""
-        if "-" in symbol:
-            return symbol
-        if "/" in symbol:
-            base, quote = symbol.split("/")
-            return f"{quote}-{base}"
-        return f"KRW-{symbol}"
+        return _to_ticker(symbol)
 
     def _normalize_interval(self, interval: str) -> str:
         """시간 간격 정규화"""
         return self.INTERVAL_MAP.get(interval, interval)
 
+    def _normalize_pair(
+        self, symbol: str, interval: Optional[str] = None
+    ) -> tuple[str, Optional[str]]:
+        """
+        (심볼, 간격) 정규화 결과를 인스턴스별로 메모이즈
+
+        _normalize_symbol / _normalize_interval (하위 클래스 오버라이드 포함)을
+        조합마다 한 번만 호출합니다. 간격이 필요 없는 호출은 interval을 생략합니다.
+        """
+        key = (symbol, interval)
+        pair = self._normalized.get(key)
+        if pair is None:
+            interval_str = None if interval is None else self._normalize_interval(interval)
+            pair = (self._normalize_symbol(symbol), interval_str)
+            self._normalized[key] = pair
+        return pair
+
     async def get_ohlcv(
         self,
         symbol: str,
@@ -68,8 +225,7 @@ class UpbitExchange(BaseExchange):
         limit: int = 200,
     ) -> pd.DataFrame:
         """OHLCV 데이터 조회"""
-        ticker = self._normalize_symbol(symbol)
-        interval_str = self._normalize_interval(interval)
+        ticker, interval_str = self._normalize_pair(symbol, interval)
 
         # 200개 이하는 한 번에 조회
         if limit <= 200:
@@ -84,41 +240,90 @@ class UpbitExchange(BaseExchange):
     async def _get_ohlcv_long(
         self, ticker: str, interval: str, days: int
     ) -> pd.DataFrame:
-        """장기 데이터 수집 (200개 초과)"""
-        all_data = []
-        to = None
-        remaining = days
+        """
+        장기 데이터 수집 (200개 초과)
+
+        첫 페이지로 기준 시각을 잡고, 봉 간격이 일정한 경우 나머지 페이지의
+        구간 경계를 미리 계산해 동시에 요청합니다.
+        """
+        await _QUOTATION_LIMITER.wait()
+        first = await asyncio.to_thread(pyupbit.get_ohlcv, ticker, interval=interval, count=200)
+        if first is None or len(first) == 0:
+            return pd.DataFrame()
+
+        buffer = _OHLCVBuffer(days)
+        buffer.prepend(first)
+        remaining = days - len(first)
+
+        step = _INTERVAL_STEPS.get(interval)
+        if step is not None and remaining > 0 and len(first) == 200:
+            counts = [200] * (remaining // 200) + ([remaining % 200] if remaining % 200 else [])
+            ends = [first.index[0] - step * 200 * k for k in range(len(counts))]
+            semaphore = asyncio.Semaphore(8)
+
+            async def fetch(to, count: int) -> pd.DataFrame | None:
+                async with semaphore:
+                    # API 제한 방지
+                    await _QUOTATION_LIMITER.wait()
+                    return await asyncio.to_thread(
+                        pyupbit.get_ohlcv, ticker, interval=interval, count=count, to=to
+                    )
+
+            pages = await asyncio.gather(*(fetch(to, count) for to, count in zip(ends, counts)))
 
+            for df in pages:
+                # 상장 이전 구간
+                if df is None or len(df) == 0:
+                    return buffer.to_dataframe()
+                buffer.prepend(df)
+
+            # 거래 없는 봉이 빠진 구간은 페이지가 겹치므로 실제 개수로 다시 계산
+            remaining = days - len(buffer)
+
+        # 남은 구간 순차 수집 (월봉 등 간격이 일정하지 않은 경우 포함)
         while remaining > 0:
-            count = min(200, remaining)
+            # to 시각의 봉이 포함돼 한 봉 겹쳐도 남은 개수를 채우도록 한 봉 더 요청
+            count = min(200, remaining + 1)
 
+            # API 제한 방지
+            await _QUOTATION_LIMITER.wait()
             df = await asyncio.to_thread(
-                pyupbit.get_ohlcv, ticker, interval=interval, count=count, to=to
+                pyupbit.get_ohlcv, ticker, interval=interval, count=count, to=buffer.oldest
             )
 
             if df is None or len(df) == 0:
                 break
 
-            all_data.append(df)
-            to = df.index[0]
-            remaining -= len(df)
-
-            # API 제한 방지
-            await asyncio.sleep(0.2)
-
-        if not all_data:
-            return pd.DataFrame()
+            # 겹친 봉은 잘려 들어가므로 실제로 늘어난 개수로 계산
+            filled = len(buffer)
+            buffer.prepend(df, limit=remaining)
+            if len(buffer) == filled:
+                break
+            remaining = days - len(buffer)
 
-        result = pd.concat(all_data)
-        result = result[~result.index.duplicated(keep="first")]
-        return result.sort_index()
+        return buffer.to_dataframe()
 
     async def get_ticker(self, symbol: str) -> dict:
         """현재가 조회"""
-        ticker = self._normalize_symbol(symbol)
+        ticker, _ = self._normalize_pair(symbol)
         price = await asyncio.to_thread(pyupbit.get_current_price, ticker)
         return {"symbol": ticker, "price": price}
 
+    async def get_tickers(self, symbols: list[str]) -> dict[str, float]:
+        """여러 심볼 현재가 일괄 조회 (한 번의 API 요청)"""
+        tickers = list(dict.fromkeys(self._normalize_pair(symbol)[0] for symbol in symbols))
+        if not tickers:
+            return {}
+
+        prices = await asyncio.to_thread(pyupbit.get_current_price, tickers)
+        if isinstance(prices, dict):
+            return prices
+
+        # 티커가 하나면 pyupbit가 dict 대신 가격만 반환 (조회 실패 시 None)
+        if len(tickers) == 1 and prices is not None:
+            return {tickers[0]: float(prices)}
+        return {}
+
     # ===== 동기 버전 (백테스팅 최적화) =====
 
     def get_ohlcv_sync(
@@ -126,40 +331,53 @@ class UpbitExchange(BaseExchange):
         symbol: str,
         interval: str = "1d",
         limit: int = 200,
-    ) -> pd.DataFrame:
-        """동기 OHLCV 조회 (백테스팅용) - 더 효율적"""
-        ticker = self._normalize_symbol(symbol)
-        interval_str = self._normalize_interval(interval)
+        raw: bool = False,
+    ) -> pd.DataFrame | CandleArray:
+        """
+        동기 OHLCV 조회 (백테스팅용) - 더 효율적
+
+        raw=True면 지표 함수에 바로 넘길 수 있는 CandleArray로 반환
+        """
+        ticker, interval_str = self._normalize_pair(symbol, interval)
 
         if limit <= 200:
-            return pyupbit.get_ohlcv(ticker, interval=interval_str, count=limit)
+            df = pyupbit.get_ohlcv(ticker, interval=interval_str, count=limit)
+        else:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # 이벤트 루프 밖에서는 페이지 동시 요청 경로 사용
+                df = asyncio.run(self._get_ohlcv_long(ticker, interval_str, limit))
+            else:
+                df = self._get_ohlcv_long_sync(ticker, interval_str, limit)
 
-        return self._get_ohlcv_long_sync(ticker, interval_str, limit)
+        if raw and df is not None:
+            return CandleArray.from_dataframe(df)
+        return df
 
     def _get_ohlcv_long_sync(self, ticker: str, interval: str, days: int) -> pd.DataFrame:
         """동기 장기 데이터 수집"""
-        all_data = []
+        buffer = _OHLCVBuffer(days)
         to = None
         remaining = days
 
         while remaining > 0:
-            count = min(200, remaining)
+            # to 시각의 봉이 포함돼 한 봉 겹쳐도 남은 개수를 채우도록 한 봉 더 요청
+            count = min(200, remaining + 1) if to is not None else min(200, remaining)
+            _QUOTATION_LIMITER.wait_sync()
             df = pyupbit.get_ohlcv(ticker, interval=interval, count=count, to=to)
 
             if df is None or len(df) == 0:
                 break
 
-            all_data.append(df)
+            filled = len(buffer)
+            buffer.prepend(df, limit=remaining)
+            if len(buffer) == filled:
+                break
             to = df.index[0]
-            remaining -= len(df)
-            time.sleep(0.2)
-
-        if not all_data:
-            return pd.DataFrame()
+            remaining = days - len(buffer)
 
-        result = pd.concat(all_data)
-        result = result[~result.index.duplicated(keep="first")]
-        return result.sort_index()
+        return buffer.to_dataframe()
 
     # ===== 거래 기능 =====
 
@@ -202,7 +420,7 @@ class UpbitExchange(BaseExchange):
         if not self._upbit:
             raise ValueError("API key required for place_order")
 
-        ticker = self._normalize_symbol(symbol)
+        ticker, _ = self._normalize_pair(symbol)
 
         if side == OrderSide.BUY:
             if order_type == OrderType.MARKET:
@@ -228,9 +446,10 @@ class UpbitExchange(BaseExchange):
             order_id=result.get("uuid", ""),
             symbol=ticker,
             side=side,
-            price=result.get("price", 0),
-            quantity=result.get("volume", 0),
-            filled_quantity=result.get("executed_volume", 0),
+            # 업비트 응답의 수치는 문자열 (시장가 매수는 volume, 시장가 매도는 price가 None)
+            price=float(result.get("price") or 0),
+            quantity=float(result.get("volume") or 0),
+            filled_quantity=float(result.get("executed_volume") or 0),
             status=OrderStatus.PENDING,
         )
 
@@ -1,8 +1,11 @@
 """기술적 지표 모듈"""
 
+from .cache import indicator_cache
 from .technical import (
     atr,
     bollinger_bands,
+    close_values,
+    compute_emas,
     ema,
     macd,
     rsi,
@@ -15,6 +18,7 @@ from .technical import (
 __all__ = [
     "sma",
     "ema",
+    "compute_emas",
     "rsi",
     "macd",
     "bollinger_bands",
@@ -22,4 +26,6 @@ __all__ = [
     "vwap_rolling",
     "atr",
     "stochastic",
+    "close_values",
+    "indicator_cache",
 ]
@@ -0,0 +1,77 @@
+"""지표 계산 캐시
+
+그리드 서치처럼 같은 데이터로 지표를 반복 계산하는 구간에서
+(지표, 입력 데이터, 파라미터) 단위로 결과를 재사용합니다.
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Iterator
+
+
+class _LRUStore(OrderedDict):
+    """최근 사용 순서를 유지하는 캐시 저장소 (maxsize 초과 시 가장 오래된 항목 제거)"""
+
+    def __init__(self, maxsize: int | None):
+        super().__init__()
+        self.maxsize = maxsize
+
+
+_active_cache: ContextVar[_LRUStore | None] = ContextVar("indicator_cache", default=None)
+
+
+@contextmanager
+def indicator_cache(maxsize: int | None = 256) -> Iterator[dict]:
+    """
+    지표 캐시 스코프
+
+    블록 안에서 같은 데이터 객체와 파라미터로 호출된 지표는 한 번만 계산됩니다.
+    중첩된 스코프는 바깥 캐시를 그대로 공유하며,
+    캐시는 가장 바깥 블록을 벗어날 때 버려집니다.
+
+    Args:
+        maxsize: 보관할 최대 결과 수 (None: 무제한). 긴 그리드 서치에서
+            메모리가 계속 늘지 않도록 가장 오래 쓰지 않은 결과부터 제거
+
+    Example:
+        with indicator_cache():
+            for params in grid:
+                strategy_class(**params).calculate(df)
+    """
+    store = _active_cache.get()
+    if store is not None:
+        yield store
+        return
+
+    store = _LRUStore(maxsize)
+    token = _active_cache.set(store)
+    try:
+        yield store
+    finally:
+        _active_cache.reset(token)
+
+
+def cached(func: Callable) -> Callable:
+    """지표 함수를 캐시 스코프 안에서 메모이즈하는 데코레이터"""
+
+    @wraps(func)
+    def wrapper(data, *args, **kwargs):
+        store = _active_cache.get()
+        if store is None:
+            return func(data, *args, **kwargs)
+
+        # id()는 객체가 살아있는 동안만 유일하므로 입력 객체도 함께 보관
+        key = (func.__name__, id(data), args, tuple(sorted(kwargs.items())))
+        hit = store.get(key)
+        if hit is None:
+            hit = (data, func(data, *args, **kwargs))
+            store[key] = hit
+            if store.maxsize is not None and len(store) > store.maxsize:
+                store.popitem(last=False)
+        else:
+            store.move_to_end(key)
+        return hit[1]
+
+    return wrapper
@@ -1,204 +1,589 @@
 """기술적 지표 함수들
 
 모든 함수는 pandas Series 또는 DataFrame을 받아서 Series를 반환합니다.
+종가 기반 지표(sma, ema, rsi, macd, bollinger_bands)는 NumPy 배열도 받으며,
+이 경우 Series 생성 없이 배열을 반환합니다. CandleArray는 종가 기반 지표와
+vwap, vwap_rolling, atr, stochastic에 그대로 넘길 수 있고 결과도 배열로 반환됩니다.
 벡터화된 연산으로 빠른 성능을 제공합니다.
 """
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
+from src._njit import NUMBA_AVAILABLE, njit
+from src.models import CandleArray
 
-def sma(data: pd.DataFrame | pd.Series, period: int) -> pd.Series:
+from .cache import cached, indicator_cache
+
+try:
+    import bottleneck as bn
+except ImportError:
+    # bottleneck 미설치: 이동 합/평균/최소/최대는 누적합/pandas rolling으로 계산
+    bn = None
+
+try:
+    from scipy.signal import lfilter
+except ImportError:
+    # scipy 미설치: numba도 없으면 EMA는 pandas ewm으로 계산
+    lfilter = None
+
+
+CloseData = pd.DataFrame | pd.Series | np.ndarray | CandleArray
+OHLCVData = pd.DataFrame | CandleArray
+
+
+@cached
+def close_values(data: CloseData) -> np.ndarray:
+    """
+    종가 float64 배열
+
+    캐시 스코프 안에서는 같은 입력에 같은 배열 객체를 돌려주므로,
+    이 배열을 지표에 넘겨도 지표 캐시가 그대로 적중합니다.
+
+    Args:
+        data: DataFrame (close 컬럼 사용), Series, 배열 또는 CandleArray
+
+    Returns:
+        종가 배열
+    """
+    if isinstance(data, CandleArray):
+        return np.asarray(data.close, dtype=np.float64)
+    if isinstance(data, pd.DataFrame):
+        data = data["close"]
+    if isinstance(data, pd.Series):
+        return data.to_numpy(dtype=np.float64)
+    return np.asarray(data, dtype=np.float64)
+
+
+def _wrap(values: np.ndarray, data: CloseData) -> pd.Series | np.ndarray:
+    """입력이 pandas면 같은 인덱스의 Series로, 배열이면 그대로 반환"""
+    if isinstance(data, pd.DataFrame):
+        data = data["close"]
+    if isinstance(data, pd.Series):
+        return pd.Series(values, index=data.index, name=data.name)
+    return values
+
+
+def _column(data: OHLCVData, name: str) -> np.ndarray:
+    """OHLCV 컬럼 float64 배열"""
+    if isinstance(data, CandleArray):
+        return np.asarray(getattr(data, name), dtype=np.float64)
+    return data[name].to_numpy(dtype=np.float64)
+
+
+def _wrap_frame(values: np.ndarray, data: OHLCVData) -> pd.Series | np.ndarray:
+    """입력이 DataFrame이면 같은 인덱스의 Series로, CandleArray면 배열 그대로 반환"""
+    if isinstance(data, pd.DataFrame):
+        return pd.Series(values, index=data.index)
+    return values
+
+
+@cached
+def sma(data: CloseData, period: int) -> pd.Series | np.ndarray:
     """
     단순 이동평균 (Simple Moving Average)
 
     Args:
-        data: DataFrame (close 컬럼 사용) 또는 Series
+        data: DataFrame (close 컬럼 사용), Series 또는 배열
         period: 이동평균 기간
 
     Returns:
-        SMA Series
+        SMA Series (배열 입력이면 배열)
     """
-    close = data["close"] if isinstance(data, pd.DataFrame) else data
-    return close.rolling(window=period).mean()
+    values = close_values(data)
+    return _wrap(_rolling_mean(values, period), data)
+
+
+def _rolling_mean(x: np.ndarray, period: int) -> np.ndarray:
+    """period 길이 윈도우 평균 (앞의 period-1개와 NaN이 포함된 윈도우는 NaN)"""
+    # bottleneck은 윈도우가 데이터보다 길면 예외
+    if bn is not None and period <= len(x):
+        return bn.move_mean(x, period, min_count=period)
+    return _rolling_sum(x, period) / period
 
 
-def ema(data: pd.DataFrame | pd.Series, period: int) -> pd.Series:
+def _rolling_sum(x: np.ndarray, period: int) -> np.ndarray:
+    """
+    period 길이 윈도우 합 (앞의 period-1개는 NaN)
+
+    bottleneck이 있으면 move_sum을 쓰고, 없으면 누적합의 차이로 O(N)에 계산합니다.
+    결측이 있으면 누적합이 이후 전부 NaN이 되므로 윈도우별로 직접 합산합니다
+    (NaN이 포함된 윈도우만 NaN).
+    """
+    if bn is not None and period <= len(x):
+        return bn.move_sum(x, period, min_count=period)
+
+    result = np.full(len(x), np.nan)
+    if len(x) < period:
+        return result
+
+    csum = np.cumsum(x)
+    if np.isnan(csum[-1]):
+        result[period - 1 :] = sliding_window_view(x, period).sum(axis=1)
+    else:
+        result[period - 1] = csum[period - 1]
+        result[period:] = csum[period:] - csum[:-period]
+
+    return result
+
+
+@cached
+def ema(data: CloseData, period: int) -> pd.Series | np.ndarray:
     """
     지수 이동평균 (Exponential Moving Average)
 
     Args:
-        data: DataFrame (close 컬럼 사용) 또는 Series
+        data: DataFrame (close 컬럼 사용), Series 또는 배열
         period: 이동평균 기간
 
     Returns:
-        EMA Series
+        EMA Series (배열 입력이면 배열)
     """
-    close = data["close"] if isinstance(data, pd.DataFrame) else data
-    return close.ewm(span=period, adjust=False).mean()
+    values = close_values(data)
+    alpha = 2 / (period + 1)
+
+    # 중간 결측치의 가중치 처리는 pandas 버전마다 달라, 앞쪽 결측만 있을 때 재귀식 사용
+    start = _first_valid(values) if _ema_recursive is not None else None
+    if start == 0:
+        result = _ema_recursive(values, alpha)
+    elif start is not None:
+        result = np.full(len(values), np.nan)
+        result[start:] = _ema_recursive(values[start:], alpha)
+    else:
+        result = pd.Series(values).ewm(span=period, adjust=False).mean().to_numpy()
+
+    return _wrap(result, data)
+
 
+def _first_valid(values: np.ndarray) -> int | None:
+    """
+    첫 유효값 위치 (앞쪽 결측 개수)
 
-def rsi(data: pd.DataFrame | pd.Series, period: int = 14) -> pd.Series:
+    다른 지표의 출력처럼 앞쪽에만 결측이 있는 입력은 그 이후 구간을 그대로
+    재귀식에 넘길 수 있습니다. 중간에 결측이 있거나 전부 결측이면 None.
     """
-    상대강도지수 (Relative Strength Index)
+    nan_mask = np.isnan(values)
+    if not nan_mask.any():
+        return 0
+
+    start = int(np.argmin(nan_mask))
+    if nan_mask[start:].any():
+        return None
+    return start
+
+
+@njit(cache=True, nogil=True)
+def _ema_loop(x: np.ndarray, alpha: float) -> np.ndarray:
+    """EMA 재귀식 y[i] = alpha * x[i] + (1 - alpha) * y[i-1]"""
+    n = x.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+
+    out[0] = x[0]
+    for i in range(1, n):
+        out[i] = alpha * x[i] + (1.0 - alpha) * out[i - 1]
+
+    return out
+
+
+def _ema_lfilter(x: np.ndarray, alpha: float) -> np.ndarray:
+    """_ema_loop와 같은 재귀식을 scipy IIR 필터로 계산 (numba 미설치 시)"""
+    out = np.empty(len(x))
+    if len(x) == 0:
+        return out
+
+    # 첫 값은 그대로 두고 y[0]을 필터 초기 상태로 넘겨 나머지를 계산
+    out[0] = x[0]
+    out[1:], _ = lfilter([alpha], [1.0, alpha - 1.0], x[1:], zi=[(1.0 - alpha) * x[0]])
+    return out
+
+
+# 결측 없는 구간의 EMA 재귀식 (numba > scipy 순, 둘 다 없으면 None: pandas ewm)
+if NUMBA_AVAILABLE:
+    _ema_recursive = _ema_loop
+elif lfilter is not None:
+    _ema_recursive = _ema_lfilter
+else:
+    _ema_recursive = None
+
+
+def compute_emas(data: CloseData, periods: list[int]) -> dict[int, pd.Series | np.ndarray]:
+    """
+    여러 기간의 EMA를 한 번에 계산
+
+    numba가 있으면 종가를 한 번만 순회하며 모든 기간의 EMA를 함께 갱신합니다.
 
     Args:
-        data: DataFrame (close 컬럼 사용) 또는 Series
-        period: RSI 기간 (기본 14)
+        data: DataFrame (close 컬럼 사용), Series 또는 배열
+        periods: EMA 기간 리스트
 
     Returns:
-        RSI Series (0-100)
+        {기간: EMA Series} (배열 입력이면 배열)
     """
-    close = data["close"] if isinstance(data, pd.DataFrame) else data
-    delta = close.diff()
+    periods = list(dict.fromkeys(periods))
+    values = close_values(data)
+
+    start = _first_valid(values) if NUMBA_AVAILABLE else None
+    if start is None or len(periods) < 2:
+        return {period: ema(data, period) for period in periods}
+
+    alphas = np.array([2 / (period + 1) for period in periods])
+    result = np.full((len(periods), len(values)), np.nan)
+    result[:, start:] = _ema_multi_loop(values[start:], alphas)
+
+    return {period: _wrap(row, data) for period, row in zip(periods, result)}
+
+
+@njit(cache=True, nogil=True)
+def _ema_multi_loop(x: np.ndarray, alphas: np.ndarray) -> np.ndarray:
+    """기간별 EMA 재귀식을 한 번의 순회로 (행: 기간, 열: 시점)"""
+    k = alphas.shape[0]
+    n = x.shape[0]
+    out = np.empty((k, n))
+    if n == 0:
+        return out
+
+    for j in range(k):
+        out[j, 0] = x[0]
+    for i in range(1, n):
+        for j in range(k):
+            out[j, i] = alphas[j] * x[i] + (1.0 - alphas[j]) * out[j, i - 1]
 
-    gain = delta.where(delta > 0, 0)
-    loss = -delta.where(delta < 0, 0)
+    return out
 
-    avg_gain = gain.rolling(window=period).mean()
-    avg_loss = loss.rolling(window=period).mean()
 
-    rs = avg_gain / avg_loss
-    return 100 - (100 / (1 + rs))
+@cached
+def rsi(data: CloseData, period: int = 14) -> pd.Series | np.ndarray:
+    """
+    상대강도지수 (Relative Strength Index, Wilder 평활)
+
+    첫 평균은 period개 변화량의 단순평균, 이후는 alpha=1/period 재귀 평활입니다.
 
+    Args:
+        data: DataFrame (close 컬럼 사용), Series 또는 배열
+        period: RSI 기간 (기본 14)
 
+    Returns:
+        RSI Series (0-100, 앞의 period개는 NaN, 배열 입력이면 배열)
+    """
+    values = close_values(data)
+
+    if NUMBA_AVAILABLE:
+        result = _rsi_wilder(values, period)
+    else:
+        delta = np.diff(values, prepend=np.nan)
+
+        # 상승/하락폭 (첫 봉과 NaN은 0)
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
+
+        result = np.full(len(values), np.nan)
+        if len(values) > period:
+            # 첫 평균을 시드로 두고 나머지는 ewm(adjust=False)로 재귀 평활
+            gain[period] = gain[1 : period + 1].mean()
+            loss[period] = loss[1 : period + 1].mean()
+            avg_gain = pd.Series(gain[period:]).ewm(alpha=1 / period, adjust=False).mean()
+            avg_loss = pd.Series(loss[period:]).ewm(alpha=1 / period, adjust=False).mean()
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rs = avg_gain.to_numpy() / avg_loss.to_numpy()
+                result[period:] = 100 - (100 / (1 + rs))
+
+    return _wrap(result, data)
+
+
+@njit(cache=True, nogil=True)
+def _rsi_wilder(close: np.ndarray, period: int) -> np.ndarray:
+    """Wilder RSI (변화량 계산부터 평활까지 한 번의 순회)"""
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    if n <= period:
+        return out
+
+    alpha = 1.0 / period
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        # NaN 변화량은 비교가 모두 거짓이므로 0으로 취급
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+
+        if i <= period:
+            # 첫 평균은 합계를 한 번에 나눔 (폴백의 mean()과 같은 반올림)
+            avg_gain += gain
+            avg_loss += loss
+            if i < period:
+                continue
+            avg_gain /= period
+            avg_loss /= period
+        else:
+            avg_gain = (1.0 - alpha) * avg_gain + alpha * gain
+            avg_loss = (1.0 - alpha) * avg_loss + alpha * loss
+
+        if avg_loss > 0:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            out[i] = 100.0
+
+    return out
+
+
+@cached
 def macd(
-    data: pd.DataFrame | pd.Series,
+    data: CloseData,
     fast: int = 12,
     slow: int = 26,
     signal: int = 9,
-) -> tuple[pd.Series, pd.Series, pd.Series]:
+) -> tuple[pd.Series, pd.Series, pd.Series] | tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     MACD (Moving Average Convergence Divergence)
 
     Args:
-        data: DataFrame (close 컬럼 사용) 또는 Series
+        data: DataFrame (close 컬럼 사용), Series 또는 배열
         fast: 빠른 EMA 기간 (기본 12)
         slow: 느린 EMA 기간 (기본 26)
         signal: 시그널 라인 기간 (기본 9)
 
     Returns:
-        (MACD 라인, 시그널 라인, 히스토그램)
+        (MACD 라인, 시그널 라인, 히스토그램) - 배열 입력이면 배열
     """
-    close = data["close"] if isinstance(data, pd.DataFrame) else data
+    values = close_values(data)
+
+    # EMA 세 개와 차이를 한 번의 순회로 계산 (앞쪽 결측은 NaN으로 두고 이후 구간만)
+    start = _first_valid(values) if NUMBA_AVAILABLE else None
+    if start is not None:
+        macd_line, signal_line, histogram = _macd_loop(
+            values, start, 2 / (fast + 1), 2 / (slow + 1), 2 / (signal + 1)
+        )
+        return _wrap(macd_line, data), _wrap(signal_line, data), _wrap(histogram, data)
+
+    # numba가 없으면 EMA별로 계산 (ema가 scipy/pandas 중 가능한 경로 선택)
+    macd_line = ema(values, fast) - ema(values, slow)
+    signal_line = ema(macd_line, signal)
+    histogram = macd_line - signal_line
 
-    ema_fast = close.ewm(span=fast, adjust=False).mean()
-    ema_slow = close.ewm(span=slow, adjust=False).mean()
+    return _wrap(macd_line, data), _wrap(signal_line, data), _wrap(histogram, data)
 
-    macd_line = ema_fast - ema_slow
-    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
-    histogram = macd_line - signal_line
+
+@njit(cache=True, nogil=True)
+def _macd_loop(
+    x: np.ndarray, start: int, alpha_fast: float, alpha_slow: float, alpha_signal: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD 라인/시그널/히스토그램 (빠른/느린/시그널 EMA를 스칼라로 유지하며 한 번의 순회)
+
+    start 이전(앞쪽 결측)은 NaN으로 채우고 start부터 재귀를 시작합니다.
+    """
+    n = x.shape[0]
+    macd_line = np.empty(n)
+    signal_line = np.empty(n)
+    histogram = np.empty(n)
+
+    for i in range(min(start, n)):
+        macd_line[i] = np.nan
+        signal_line[i] = np.nan
+        histogram[i] = np.nan
+    if start >= n:
+        return macd_line, signal_line, histogram
+
+    ema_fast = x[start]
+    ema_slow = x[start]
+    ema_signal = ema_fast - ema_slow
+
+    for i in range(start, n):
+        if i > start:
+            ema_fast = alpha_fast * x[i] + (1.0 - alpha_fast) * ema_fast
+            ema_slow = alpha_slow * x[i] + (1.0 - alpha_slow) * ema_slow
+            ema_signal = alpha_signal * (ema_fast - ema_slow) + (1.0 - alpha_signal) * ema_signal
+
+        macd_line[i] = ema_fast - ema_slow
+        signal_line[i] = ema_signal
+        histogram[i] = macd_line[i] - ema_signal
 
     return macd_line, signal_line, histogram
 
 
+@cached
 def bollinger_bands(
-    data: pd.DataFrame | pd.Series,
+    data: CloseData,
     period: int = 20,
     std_dev: float = 2.0,
-) -> tuple[pd.Series, pd.Series, pd.Series]:
+) -> tuple[pd.Series, pd.Series, pd.Series] | tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     볼린저 밴드 (Bollinger Bands)
 
     Args:
-        data: DataFrame (close 컬럼 사용) 또는 Series
+        data: DataFrame (close 컬럼 사용), Series 또는 배열
         period: 이동평균 기간 (기본 20)
         std_dev: 표준편차 배수 (기본 2)
 
     Returns:
-        (상단 밴드, 중간 밴드, 하단 밴드)
+        (상단 밴드, 중간 밴드, 하단 밴드) - 배열 입력이면 배열
     """
-    close = data["close"] if isinstance(data, pd.DataFrame) else data
+    values = close_values(data)
 
-    middle = close.rolling(window=period).mean()
-    std = close.rolling(window=period).std()
+    if NUMBA_AVAILABLE:
+        middle, std = _rolling_mean_std(values, period)
+    else:
+        # bottleneck move_std는 짧은 윈도우에서 정밀도가 떨어져 표준편차는 pandas로 계산
+        middle = _rolling_mean(values, period)
+        std = pd.Series(values).rolling(window=period).std().to_numpy()
 
     upper = middle + (std * std_dev)
     lower = middle - (std * std_dev)
 
-    return upper, middle, lower
+    return _wrap(upper, data), _wrap(middle, data), _wrap(lower, data)
+
 
+@njit(cache=True, nogil=True)
+def _rolling_mean_std(x: np.ndarray, period: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    롤링 평균과 표본 표준편차 (ddof=1)를 한 커널에서 함께 계산
 
-def vwap(data: pd.DataFrame) -> pd.Series:
+    가격 수준(1e8)에 비해 분산이 작아 누적 제곱합 방식은 정밀도가 떨어지므로,
+    윈도우마다 평균을 구한 뒤 편차 제곱합을 직접 더합니다 (period가 작아 비용은 미미).
+    NaN이 포함된 윈도우는 NaN (pandas rolling 기본 동작과 동일).
+    """
+    n = x.shape[0]
+    mean_out = np.full(n, np.nan)
+    std_out = np.full(n, np.nan)
+
+    for i in range(period - 1, n):
+        total = 0.0
+        for j in range(i - period + 1, i + 1):
+            total += x[j]
+        mean = total / period
+        mean_out[i] = mean
+
+        if period > 1:
+            ssq = 0.0
+            for j in range(i - period + 1, i + 1):
+                ssq += (x[j] - mean) * (x[j] - mean)
+            std_out[i] = np.sqrt(ssq / (period - 1))
+
+    return mean_out, std_out
+
+
+@cached
+def vwap(data: OHLCVData) -> pd.Series | np.ndarray:
     """
     VWAP (Volume Weighted Average Price) - 누적
 
     Args:
-        data: DataFrame with high, low, close, volume columns
+        data: DataFrame (high, low, close, volume 컬럼) 또는 CandleArray
 
     Returns:
-        VWAP Series
+        VWAP Series (CandleArray 입력이면 배열)
     """
-    typical_price = (data["high"] + data["low"] + data["close"]) / 3
-    return (typical_price * data["volume"]).cumsum() / data["volume"].cumsum()
+    volume = _column(data, "volume")
+    pv = (_column(data, "high") + _column(data, "low") + _column(data, "close")) / 3
+    pv *= volume
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = _cumsum_skipna(pv) / _cumsum_skipna(volume)
+
+    return _wrap_frame(result, data)
 
 
-def vwap_rolling(data: pd.DataFrame, period: int = 20) -> pd.Series:
+def _cumsum_skipna(x: np.ndarray) -> np.ndarray:
+    """결측을 건너뛰는 누적합 (결측 위치만 NaN, pandas cumsum과 동일)"""
+    result = np.cumsum(x)
+    if np.isnan(result[-1:]).any():
+        nan_mask = np.isnan(x)
+        result = np.nancumsum(x)
+        result[nan_mask] = np.nan
+    return result
+
+
+@cached
+def vwap_rolling(data: OHLCVData, period: int = 20) -> pd.Series | np.ndarray:
     """
     Rolling VWAP (일정 기간 기준)
 
     Args:
-        data: DataFrame with high, low, close, volume columns
+        data: DataFrame (high, low, close, volume 컬럼) 또는 CandleArray
         period: 롤링 기간 (기본 20)
 
     Returns:
-        Rolling VWAP Series
+        Rolling VWAP Series (CandleArray 입력이면 배열)
     """
-    typical_price = (data["high"] + data["low"] + data["close"]) / 3
-    pv = typical_price * data["volume"]
-    return pv.rolling(window=period).sum() / data["volume"].rolling(window=period).sum()
+    high = _column(data, "high")
+    low = _column(data, "low")
+    close = _column(data, "close")
+    volume = _column(data, "volume")
+
+    typical_price = (high + low + close) / 3
+    pv = typical_price * volume
 
+    # 윈도우 합은 누적합 차이로 계산 (앞의 period-1개는 NaN)
+    result = _rolling_sum(pv, period) / _rolling_sum(volume, period)
 
-def atr(data: pd.DataFrame, period: int = 14) -> pd.Series:
+    return _wrap_frame(result, data)
+
+
+@cached
+def atr(data: OHLCVData, period: int = 14) -> pd.Series | np.ndarray:
     """
     평균 실제 범위 (Average True Range)
 
     Args:
-        data: DataFrame with high, low, close columns
+        data: DataFrame (high, low, close 컬럼) 또는 CandleArray
         period: ATR 기간 (기본 14)
 
     Returns:
-        ATR Series
+        ATR Series (CandleArray 입력이면 배열)
     """
-    high = data["high"]
-    low = data["low"]
-    close = data["close"]
+    high = _column(data, "high")
+    low = _column(data, "low")
+    close = _column(data, "close")
+    prev_close = np.concatenate(([np.nan], close[:-1]))
 
-    tr1 = high - low
-    tr2 = abs(high - close.shift(1))
-    tr3 = abs(low - close.shift(1))
+    # 세 후보 중 최대값 (fmax는 NaN을 건너뜀: 첫 봉은 고가 - 저가)
+    true_range = high - low
+    np.fmax(true_range, np.abs(high - prev_close), out=true_range)
+    np.fmax(true_range, np.abs(low - prev_close), out=true_range)
 
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    return true_range.rolling(window=period).mean()
+    return _wrap_frame(_rolling_mean(true_range, period), data)
 
 
+@cached
 def stochastic(
-    data: pd.DataFrame,
+    data: OHLCVData,
     k_period: int = 14,
     d_period: int = 3,
-) -> tuple[pd.Series, pd.Series]:
+) -> tuple[pd.Series, pd.Series] | tuple[np.ndarray, np.ndarray]:
     """
     스토캐스틱 (Stochastic Oscillator)
 
     Args:
-        data: DataFrame with high, low, close columns
+        data: DataFrame (high, low, close 컬럼) 또는 CandleArray
         k_period: %K 기간 (기본 14)
         d_period: %D 기간 (기본 3)
 
     Returns:
-        (%K, %D)
+        (%K, %D) - CandleArray 입력이면 배열
     """
-    high = data["high"]
-    low = data["low"]
-    close = data["close"]
+    high = _column(data, "high")
+    low = _column(data, "low")
+    close = _column(data, "close")
 
-    lowest_low = low.rolling(window=k_period).min()
-    highest_high = high.rolling(window=k_period).max()
+    # 윈도우에 결측이 있으면 NaN (rolling의 min_periods=window와 같음)
+    if bn is not None and k_period <= len(low):
+        lowest_low = bn.move_min(low, k_period, min_count=k_period)
+        highest_high = bn.move_max(high, k_period, min_count=k_period)
+    else:
+        lowest_low = pd.Series(low).rolling(window=k_period).min().to_numpy()
+        highest_high = pd.Series(high).rolling(window=k_period).max().to_numpy()
 
-    stoch_k = 100 * (close - lowest_low) / (highest_high - lowest_low)
-    stoch_d = stoch_k.rolling(window=d_period).mean()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stoch_k = 100 * (close - lowest_low) / (highest_high - lowest_low)
+    stoch_d = _rolling_mean(stoch_k, d_period)
 
-    return stoch_k, stoch_d
+    return _wrap_frame(stoch_k, data), _wrap_frame(stoch_d, data)
 
 
 # ===== 편의 함수 =====
@@ -220,22 +605,52 @@ def add_all_indicators(
     Returns:
         지표가 추가된 DataFrame
     """
+    # 지표는 원본 종가로 한 번씩만 계산 (캐시 스코프 안에서 종가 배열도 공유)
+    with indicator_cache():
+        close = close_values(df)
+        emas = compute_emas(close, ema_periods)
+        rsi_values = rsi(close, rsi_period)
+        macd_values = macd(close)
+        bb_values = bollinger_bands(close)
+        vwap_values = vwap_rolling(df, 20)
+
     df = df.copy()
 
     # EMA
     for period in ema_periods:
-        df[f"ema_{period}"] = ema(df, period)
+        df[f"ema_{period}"] = emas[period]
 
     # RSI
-    df["rsi"] = rsi(df, rsi_period)
+    df["rsi"] = rsi_values
 
     # MACD
-    df["macd"], df["macd_signal"], df["macd_hist"] = macd(df)
+    df["macd"], df["macd_signal"], df["macd_hist"] = macd_values
 
     # Bollinger Bands
-    df["bb_upper"], df["bb_middle"], df["bb_lower"] = bollinger_bands(df)
+    df["bb_upper"], df["bb_middle"], df["bb_lower"] = bb_values
 
     # VWAP
-    df["vwap"] = vwap_rolling(df, 20)
+    df["vwap"] = vwap_values.to_numpy()
 
     return df
+
+
+def _warmup() -> None:
+    """JIT 커널을 더미 배열로 한 번씩 호출해 컴파일 (첫 지표 계산 지연 제거)"""
+    # pandas가 돌려주는 종가 배열(읽기 전용)과 중간 결과 배열(쓰기 가능) 모두 컴파일
+    writable = np.ones(2)
+    readonly = np.ones(2)
+    readonly.flags.writeable = False
+
+    _ema_loop(readonly, 0.5)
+    _ema_loop(writable, 0.5)
+    _ema_multi_loop(readonly, writable)
+    _ema_multi_loop(writable, writable)
+    _macd_loop(readonly, 0, 0.5, 0.5, 0.5)
+    _rsi_wilder(readonly, 1)
+    _rolling_mean_std(readonly, 1)
+
+
+# 임포트 시점에 컴파일 (cache=True이므로 두 번째 실행부터는 디스크 캐시 로드)
+if NUMBA_AVAILABLE:
+    _warmup()
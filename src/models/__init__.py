@@ -1,9 +1,11 @@
 from .candle import Candle
+from .candle_array import CandleArray
 from .order import Order, OrderResult, OrderSide, OrderStatus, OrderType, Position
 from .signal import Signal, SignalAction
 
 __all__ = [
     "Candle",
+    "CandleArray",
     "Order",
     "OrderResult",
     "OrderSide",
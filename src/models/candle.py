@@ -2,7 +2,6 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from decimal import Decimal
 
 
 @dataclass(slots=True, frozen=True)
@@ -10,20 +9,20 @@ class Candle:
     """OHLCV 캔들 데이터"""
 
     timestamp: datetime
-    open: Decimal
-    high: Decimal
-    low: Decimal
-    close: Decimal
-    volume: Decimal
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
 
     @classmethod
     def from_dict(cls, data: dict) -> "Candle":
         """딕셔너리에서 생성"""
         return cls(
             timestamp=data["timestamp"],
-            open=Decimal(str(data["open"])),
-            high=Decimal(str(data["high"])),
-            low=Decimal(str(data["low"])),
-            close=Decimal(str(data["close"])),
-            volume=Decimal(str(data["volume"])),
+            open=float(data["open"]),
+            high=float(data["high"]),
+            low=float(data["low"]),
+            close=float(data["close"]),
+            volume=float(data["volume"]),
         )
@@ -0,0 +1,52 @@
+"""컬럼 배열 (SoA) 캔들 데이터 모델"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+_PRICE_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass(slots=True, eq=False)
+class CandleArray:
+    """
+    OHLCV 캔들 배열
+
+    Candle 리스트 대신 필드별 연속 배열로 보관합니다.
+    지표 함수에 그대로 넘기면 Series 생성 없이 배열 결과를 돌려받습니다.
+    """
+
+    timestamp: np.ndarray  # int64 (epoch ns)
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "CandleArray":
+        """
+        OHLCV DataFrame에서 생성
+
+        Args:
+            df: open, high, low, close, volume 컬럼과 DatetimeIndex를 가진 DataFrame
+
+        Returns:
+            CandleArray
+        """
+        timestamp = pd.DatetimeIndex(df.index).as_unit("ns").asi8
+
+        # 컬럼별로 꺼내면 float64 컬럼은 복사 없이 연속 배열을 공유
+        columns = [df[name].to_numpy(dtype=np.float64) for name in _PRICE_FIELDS]
+        return cls(timestamp, *columns)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """OHLCV DataFrame으로 변환 (DatetimeIndex)"""
+        return pd.DataFrame(
+            {name: getattr(self, name) for name in _PRICE_FIELDS},
+            index=pd.to_datetime(self.timestamp, unit="ns"),
+        )
@@ -2,7 +2,6 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from decimal import Decimal
 from enum import Enum
 from typing import Optional
 
@@ -38,8 +37,8 @@ class Order:
     symbol: str
     side: OrderSide
     order_type: OrderType
-    quantity: Decimal
-    price: Optional[Decimal] = None
+    quantity: float
+    price: Optional[float] = None
     order_id: str = ""
     status: OrderStatus = OrderStatus.PENDING
     created_at: datetime = field(default_factory=datetime.now)
@@ -52,11 +51,11 @@ class OrderResult:
     order_id: str
     symbol: str
     side: OrderSide
-    price: Decimal
-    quantity: Decimal
-    filled_quantity: Decimal
+    price: float
+    quantity: float
+    filled_quantity: float
     status: OrderStatus
-    fee: Decimal = Decimal("0")
+    fee: float = 0.0
     timestamp: datetime = field(default_factory=datetime.now)
 
 
@@ -66,13 +65,13 @@ class Position:
 
     symbol: str
     side: OrderSide
-    quantity: Decimal
-    entry_price: Decimal
-    current_price: Decimal = Decimal("0")
-    unrealized_pnl: Decimal = Decimal("0")
-    realized_pnl: Decimal = Decimal("0")
+    quantity: float
+    entry_price: float
+    current_price: float = 0.0
+    unrealized_pnl: float = 0.0
+    realized_pnl: float = 0.0
 
-    def update_price(self, price: Decimal) -> None:
+    def update_price(self, price: float) -> None:
         """현재가 업데이트"""
         self.current_price = price
         if self.side == OrderSide.BUY:
@@ -1,6 +1,6 @@
 """전략 모듈"""
 
-from .base import BaseStrategy
+from .base import BaseStrategy, IndicatorStrategy
 from .ema_cross import EMACrossStrategy
 
 # 전략 레지스트리
@@ -11,11 +11,14 @@ _STRATEGIES: dict[str, type[BaseStrategy]] = {
 
 def get_strategy(name: str, **kwargs) -> BaseStrategy:
     """전략 인스턴스 팩토리"""
-    if name not in _STRATEGIES:
+    try:
+        strategy_class = _STRATEGIES[name]
+    except KeyError:
+        # 오류 메시지는 실패한 경우에만 구성
         available = ", ".join(_STRATEGIES.keys())
-        raise ValueError(f"Unknown strategy: {name}. Available: {available}")
+        raise ValueError(f"Unknown strategy: {name}. Available: {available}") from None
 
-    return _STRATEGIES[name](**kwargs)
+    return strategy_class(**kwargs)
 
 
 def register_strategy(name: str, strategy_class: type[BaseStrategy]) -> None:
@@ -30,6 +33,7 @@ def list_strategies() -> list[str]:
 
 __all__ = [
     "BaseStrategy",
+    "IndicatorStrategy",
     "EMACrossStrategy",
     "get_strategy",
     "register_strategy",
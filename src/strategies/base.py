@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 
+import numpy as np
 import pandas as pd
 
 from src.models import Signal, SignalAction
@@ -35,7 +36,7 @@ class BaseStrategy(ABC):
             df: OHLCV DataFrame
 
         Returns:
-            DataFrame with 'signal' column
+            df와 같은 인덱스의 DataFrame ('signal' 컬럼 필수, 지표 컬럼 등 추가 가능)
             - 1: 매수 (long)
             - -1: 매도 (short)
             - 0: 관망 (neutral)
@@ -73,3 +74,65 @@ class BaseStrategy(ABC):
     def __repr__(self) -> str:
         params_str = ", ".join(f"{k}={v}" for k, v in self.params.items())
         return f"{self.__class__.__name__}({params_str})"
+
+
+class IndicatorStrategy(BaseStrategy):
+    """
+    지표 계산과 신호 생성을 나눈 전략 기본 클래스
+
+    compute_indicators / generate_signals를 구현하면 calculate는 두 단계를 이어 호출합니다.
+    그리드 서치는 indicator_key가 같은 조합끼리 지표를 한 번만 계산합니다.
+    """
+
+    @property
+    def indicator_key(self) -> tuple | None:
+        """
+        지표 계산에 영향을 주는 파라미터 (그리드 서치 지표 공유용)
+
+        키가 같은 전략끼리는 compute_indicators 결과를 재사용합니다.
+        None이면 (기본) 공유하지 않고 조합마다 지표를 다시 계산합니다.
+        """
+        return None
+
+    @abstractmethod
+    def compute_indicators(self, df: pd.DataFrame) -> dict[str, np.ndarray]:
+        """
+        지표 계산 (신호 파라미터와 무관한 부분)
+
+        Args:
+            df: OHLCV DataFrame
+
+        Returns:
+            {컬럼명: 지표 배열}
+        """
+        pass
+
+    @abstractmethod
+    def generate_signals(self, df: pd.DataFrame, indicators: dict[str, np.ndarray]) -> np.ndarray:
+        """
+        미리 계산한 지표로 신호 생성
+
+        Args:
+            df: OHLCV DataFrame
+            indicators: compute_indicators 결과 (수정하지 않음)
+
+        Returns:
+            신호 배열 (1: 매수, -1: 매도, 0: 관망)
+        """
+        pass
+
+    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
+        """지표 계산 후 신호 생성 (compute_indicators -> calculate_from)"""
+        return self.calculate_from(df, self.compute_indicators(df))
+
+    def calculate_from(self, df: pd.DataFrame, indicators: dict[str, np.ndarray]) -> pd.DataFrame:
+        """
+        미리 계산한 지표로 결과 DataFrame 구성 (지표 컬럼 + signal)
+
+        호출자는 새 컬럼만 읽으므로 OHLCV 컬럼은 포함하지 않습니다. 그리드 서치에서
+        조합마다 원본 df를 복사하거나 컬럼을 하나씩 삽입하지 않고, 지표 배열을 복사 없이
+        감싼 프레임만 만듭니다 (지표 배열은 캐시와 공유되므로 제자리 수정하면 안 됨).
+        """
+        columns = dict(indicators)
+        columns["signal"] = self.generate_signals(df, indicators)
+        return pd.DataFrame(columns, index=df.index, copy=False)
@@ -1,13 +1,28 @@
 """EMA 크로스 전략"""
 
+import numpy as np
 import pandas as pd
 
-from src.indicators import ema, rsi
+from src.indicators import close_values, ema, rsi
 
-from .base import BaseStrategy
+from .base import IndicatorStrategy
 
 
-class EMACrossStrategy(BaseStrategy):
+def _cross_signal(
+    short: np.ndarray, long: np.ndarray, allow_long: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    크로스 신호 (단기 > 장기: 1, 단기 < 장기: -1, 그 외: 0, int8)
+
+    allow_long이 주어지면 False인 위치의 매수 신호는 0 (필터를 한 번에 적용)
+    """
+    up = short > long
+    if allow_long is not None:
+        up &= allow_long
+    return up.astype(np.int8) - (short < long)
+
+
+class EMACrossStrategy(IndicatorStrategy):
     """
     EMA 크로스 전략
 
@@ -31,8 +46,33 @@ class EMACrossStrategy(BaseStrategy):
         self.trend_period = trend_period
         self.rsi_period = rsi_period
         self.rsi_threshold = rsi_threshold
-        self.use_trend_filter = use_trend_filter
-        self.use_rsi_filter = use_rsi_filter
+        self._use_trend_filter = bool(use_trend_filter)
+        self._use_rsi_filter = bool(use_rsi_filter)
+
+        # 필터 조합별 신호 생성 경로를 미리 선택 (호출마다 분기 없음)
+        self._select_signal_builder()
+
+    @property
+    def use_trend_filter(self) -> bool:
+        return self._use_trend_filter
+
+    @use_trend_filter.setter
+    def use_trend_filter(self, value: bool) -> None:
+        self._use_trend_filter = bool(value)
+        self._select_signal_builder()
+
+    @property
+    def use_rsi_filter(self) -> bool:
+        return self._use_rsi_filter
+
+    @use_rsi_filter.setter
+    def use_rsi_filter(self, value: bool) -> None:
+        self._use_rsi_filter = bool(value)
+        self._select_signal_builder()
+
+    def _select_signal_builder(self) -> None:
+        """현재 필터 조합의 신호 생성 함수 선택 (필터를 바꾸면 다시 선택)"""
+        self._generate = _SIGNAL_BUILDERS[(self._use_trend_filter, self._use_rsi_filter)]
 
     @property
     def name(self) -> str:
@@ -53,39 +93,42 @@ class EMACrossStrategy(BaseStrategy):
     def min_bars(self) -> int:
         return max(self.short_period, self.long_period, self.trend_period) + 10
 
-    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
-        """지표 계산 및 신호 생성"""
-        df = df.copy()
-
-        # EMA 계산
-        df["ema_short"] = ema(df, self.short_period)
-        df["ema_long"] = ema(df, self.long_period)
+    @property
+    def indicator_key(self) -> tuple:
+        # rsi_threshold는 신호 생성에만 쓰이므로 제외
+        return (
+            self.short_period,
+            self.long_period,
+            self.trend_period,
+            self.rsi_period,
+            self.use_trend_filter,
+            self.use_rsi_filter,
+        )
+
+    def compute_indicators(self, df: pd.DataFrame) -> dict[str, np.ndarray]:
+        """EMA/추세 EMA/RSI 계산"""
+        # 종가 배열을 한 번만 꺼내 지표에 전달 (지표는 Series 없이 배열 반환)
+        # 원본 df 기준으로 꺼내므로 지표 캐시가 호출 간에 재사용됨
+        close = close_values(df)
+        indicators = {
+            "ema_short": ema(close, self.short_period),
+            "ema_long": ema(close, self.long_period),
+        }
 
         if self.use_trend_filter:
-            df["ema_trend"] = ema(df, self.trend_period)
+            indicators["ema_trend"] = ema(close, self.trend_period)
 
         if self.use_rsi_filter:
-            df["rsi"] = rsi(df, self.rsi_period)
-
-        # 기본 신호: EMA 크로스
-        df["signal"] = 0
-        df.loc[df["ema_short"] > df["ema_long"], "signal"] = 1
-        df.loc[df["ema_short"] < df["ema_long"], "signal"] = -1
+            indicators["rsi"] = rsi(close, self.rsi_period)
 
-        # 추세 필터: 상승 추세에서만 롱
-        if self.use_trend_filter:
-            uptrend = df["close"] > df["ema_trend"]
-            df.loc[(df["signal"] == 1) & ~uptrend, "signal"] = 0
-
-        # RSI 필터: RSI > threshold에서만 롱
-        if self.use_rsi_filter:
-            rsi_ok = df["rsi"] > self.rsi_threshold
-            df.loc[(df["signal"] == 1) & ~rsi_ok, "signal"] = 0
+        return indicators
 
-        return df
+    def generate_signals(self, df: pd.DataFrame, indicators: dict[str, np.ndarray]) -> np.ndarray:
+        """EMA 크로스 신호 + 추세/RSI 필터"""
+        return self._generate(self, df, indicators)
 
 
-class SimpleEMACrossStrategy(BaseStrategy):
+class SimpleEMACrossStrategy(IndicatorStrategy):
     """
     단순 EMA 크로스 전략 (필터 없음)
 
@@ -111,14 +154,51 @@ class SimpleEMACrossStrategy(BaseStrategy):
     def min_bars(self) -> int:
         return self.long_period + 5
 
-    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
+    @property
+    def indicator_key(self) -> tuple:
+        return (self.short_period, self.long_period)
+
+    def compute_indicators(self, df: pd.DataFrame) -> dict[str, np.ndarray]:
+        close = close_values(df)
+        return {
+            "ema_short": ema(close, self.short_period),
+            "ema_long": ema(close, self.long_period),
+        }
+
+    def generate_signals(self, df: pd.DataFrame, indicators: dict[str, np.ndarray]) -> np.ndarray:
+        return _cross_signal(indicators["ema_short"], indicators["ema_long"])
+
+
+# ===== 필터 조합별 신호 생성 (EMACrossStrategy 생성 시/필터 변경 시 선택) =====
+# 추세 필터: 상승 추세(종가 > 추세 EMA)에서만 롱
+# RSI 필터: RSI > threshold에서만 롱
+# 필터는 EMA 크로스 신호 생성 시 함께 적용 (마스크 쓰기 없이 한 번에 생성)
+
+
+def _signals_plain(strategy: EMACrossStrategy, df: pd.DataFrame, ind: dict) -> np.ndarray:
+    return _cross_signal(ind["ema_short"], ind["ema_long"])
+
+
+def _signals_trend(strategy: EMACrossStrategy, df: pd.DataFrame, ind: dict) -> np.ndarray:
+    uptrend = close_values(df) > ind["ema_trend"]
+    return _cross_signal(ind["ema_short"], ind["ema_long"], uptrend)
+
+
+def _signals_rsi(strategy: EMACrossStrategy, df: pd.DataFrame, ind: dict) -> np.ndarray:
+    rsi_ok = ind["rsi"] > strategy.rsi_threshold
+    return _cross_signal(ind["ema_short"], ind["ema_long"], rsi_ok)
+
 
-        df["ema_short"] = ema(df, self.short_period)
-        df["ema_long"] = ema(df, self.long_period)
+def _signals_both(strategy: EMACrossStrategy, df: pd.DataFrame, ind: dict) -> np.ndarray:
+    allow_long = close_values(df) > ind["ema_trend"]
+    allow_long &= ind["rsi"] > strategy.rsi_threshold
+    return _cross_signal(ind["ema_short"], ind["ema_long"], allow_long)
 
-        df["signal"] = 0
-        df.loc[df["ema_short"] > df["ema_long"], "signal"] = 1
-        df.loc[df["ema_short"] < df["ema_long"], "signal"] = -1
 
-        return df
+# (use_trend_filter, use_rsi_filter) -> 신호 생성 함수
+_SIGNAL_BUILDERS = {
+    (False, False): _signals_plain,
+    (True, False): _signals_trend,
+    (False, True): _signals_rsi,
+    (True, True): _signals_both,
+}
@@ -0,0 +1,75 @@
+"""공용 테스트 픽스처"""
+
+import sys
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# pyupbit가 없어도 거래소 모듈을 import할 수 있도록 빈 모듈 등록 (호출은 fake_pyupbit가 대체)
+try:
+    import pyupbit  # noqa: F401
+except ImportError:
+    sys.modules["pyupbit"] = types.ModuleType("pyupbit")
+
+
+def make_ohlcv(n: int = 300, seed: int = 0, end: str = "2024-12-31") -> pd.DataFrame:
+    """랜덤 워크 일봉 OHLCV"""
+    rng = np.random.default_rng(seed)
+    close = 5e7 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    index = pd.date_range(end=end, periods=n, freq="D")
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": rng.uniform(1, 10, n),
+            "value": close,
+        },
+        index=index,
+    )
+
+
+class FakePyupbit:
+    """
+    pyupbit 시세 조회 대역
+
+    get_ohlcv는 to 이전 봉 중 최근 count개를 반환합니다.
+    inclusive=True면 to 시각의 봉도 포함해 페이지가 한 봉씩 겹칩니다.
+    """
+
+    def __init__(self, data: pd.DataFrame, inclusive: bool = False):
+        self.data = data
+        self.inclusive = inclusive
+        self.calls: list[tuple] = []
+
+    def get_ohlcv(self, ticker, interval="day", count=200, to=None, period=0.1):
+        self.calls.append((ticker, interval, count, to))
+        df = self.data
+        if to is not None:
+            to = pd.Timestamp(to)
+            df = df[df.index <= to] if self.inclusive else df[df.index < to]
+        df = df.iloc[-count:]
+        return df.copy() if len(df) else None
+
+    def get_current_price(self, ticker):
+        if isinstance(ticker, list):
+            return {t: 1.0 for t in ticker}
+        return 1.0
+
+
+@pytest.fixture
+def ohlcv() -> pd.DataFrame:
+    return make_ohlcv()
+
+
+@pytest.fixture
+def fake_pyupbit(monkeypatch) -> FakePyupbit:
+    """업비트 어댑터가 쓰는 pyupbit를 1000개 일봉 대역으로 교체"""
+    from src.exchanges import upbit
+
+    fake = FakePyupbit(make_ohlcv(1000, seed=1))
+    monkeypatch.setattr(upbit, "pyupbit", fake)
+    return fake
@@ -0,0 +1,89 @@
+"""BacktestEngine 그리드 서치 / Walk-Forward 테스트"""
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest import BacktestEngine
+from src.strategies import EMACrossStrategy
+from src.strategies.ema_cross import SimpleEMACrossStrategy
+
+
+class BandStrategy(SimpleEMACrossStrategy):
+    """생성자 인자(정수 %)와 보고하는 파라미터(소수) 타입이 다른 전략"""
+
+    def __init__(self, short_period: int = 5, long_period: int = 20, band: int = 1):
+        super().__init__(short_period, long_period)
+        self.band = band / 100
+
+    @property
+    def params(self) -> dict:
+        return {**super().params, "band": self.band}
+
+
+def test_grid_search_keeps_reported_param_values(ohlcv):
+    results = BacktestEngine().grid_search(
+        ohlcv, BandStrategy, {"short_period": [3, 5], "band": [1, 2]}
+    )
+
+    assert len(results) == 4
+    assert sorted(results["band"].unique()) == [0.01, 0.02]
+    assert pd.api.types.is_float_dtype(results["band"])
+    assert pd.api.types.is_integer_dtype(results["short_period"])
+
+
+def test_grid_search_param_dtypes(ohlcv):
+    param_grid = {"short_period": [3, 5], "use_rsi_filter": [True, False]}
+    results = BacktestEngine().grid_search(ohlcv, EMACrossStrategy, param_grid)
+
+    assert len(results) == 4
+    assert pd.api.types.is_integer_dtype(results["short_period"])
+    assert pd.api.types.is_bool_dtype(results["use_rsi_filter"])
+    assert pd.api.types.is_float_dtype(results["sharpe_ratio"])
+    assert results["sharpe_ratio"].is_monotonic_decreasing
+
+
+def test_grid_search_parallel_matches_serial(ohlcv):
+    engine = BacktestEngine()
+    param_grid = {"short_period": [3, 5], "band": [1, 2]}
+
+    serial = engine.grid_search(ohlcv, BandStrategy, param_grid)
+    parallel = engine.grid_search(ohlcv, BandStrategy, param_grid, n_jobs=2)
+
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_grid_search_rejects_zero_jobs(ohlcv):
+    with pytest.raises(ValueError, match="n_jobs"):
+        BacktestEngine().grid_search(ohlcv, EMACrossStrategy, {"short_period": [3]}, n_jobs=0)
+
+
+def test_walk_forward_reuses_train_results(ohlcv):
+    engine = BacktestEngine()
+    param_grid = {"short_period": [3, 5]}
+
+    engine.walk_forward(ohlcv, EMACrossStrategy, param_grid)
+    (cached,) = engine._train_cache.values()
+    engine.walk_forward(ohlcv, EMACrossStrategy, param_grid)
+
+    assert len(engine._train_cache) == 1
+    assert next(iter(engine._train_cache.values())) is cached
+
+    # 종가 dtype이 바뀌면 결과도 달라지므로 다시 계산
+    engine.price_dtype = np.float32
+    engine.walk_forward(ohlcv, EMACrossStrategy, param_grid)
+    assert len(engine._train_cache) == 2
+
+
+def test_train_cache_is_bounded_and_not_pickled(ohlcv, monkeypatch):
+    from src.backtest import engine as engine_module
+
+    monkeypatch.setattr(engine_module, "_TRAIN_CACHE_SIZE", 2)
+    engine = BacktestEngine()
+    for short_period in (3, 4, 5):
+        engine.walk_forward(ohlcv, EMACrossStrategy, {"short_period": [short_period]})
+
+    assert len(engine._train_cache) == 2
+    assert len(pickle.loads(pickle.dumps(engine))._train_cache) == 0
@@ -0,0 +1,151 @@
+"""백테스트 수익률 계산 경로 테스트 (JIT 커널 / NumPy 대체 경로 / pandas 기준식)"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest import BacktestEngine, _kernels, engine, metrics
+from src.strategies.base import BaseStrategy
+
+from .conftest import make_ohlcv
+
+
+class FixedSignalStrategy(BaseStrategy):
+    """미리 정한 신호 배열을 그대로 내보내는 전략"""
+
+    def __init__(self, signals: np.ndarray):
+        self.signals = signals
+
+    @property
+    def name(self) -> str:
+        return "Fixed"
+
+    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame({"signal": self.signals}, index=df.index)
+
+
+def nan_signals(n: int) -> np.ndarray:
+    """앞쪽과 중간에 NaN이 섞인 0/1 float 신호"""
+    signals = (np.arange(n) // 17 % 2).astype(np.float64)
+    signals[:20] = np.nan
+    signals[100:103] = np.nan
+    signals[150] = np.nan
+    return signals
+
+
+def reference_returns(close: np.ndarray, signals: np.ndarray, total_cost: float) -> np.ndarray:
+    """리팩터링 전 pandas 수익률 계산식"""
+    close = pd.Series(close, dtype=np.float64)
+    signals = pd.Series(signals, dtype=np.float64)
+    position_changes = signals.diff().fillna(0).abs()
+    returns = (close.pct_change() * signals.shift(1)) - (position_changes * total_cost)
+    return returns.fillna(0).to_numpy()
+
+
+@pytest.fixture(params=["kernel", "numpy"])
+def backtest_path(request, monkeypatch):
+    """엔진/지표 계산을 JIT 커널 경로 또는 NumPy 대체 경로로 고정"""
+    use_kernels = request.param == "kernel"
+    monkeypatch.setattr(engine, "NUMBA_AVAILABLE", use_kernels)
+    monkeypatch.setattr(metrics, "NUMBA_AVAILABLE", use_kernels)
+    return request.param
+
+
+def test_nan_signals_match_pandas_baseline(backtest_path):
+    df = make_ohlcv(300)
+    signals = nan_signals(len(df))
+    bt = BacktestEngine()
+
+    result = bt.run(df, FixedSignalStrategy(signals))
+
+    expected = reference_returns(df["close"].to_numpy(), signals, bt.total_cost)
+    np.testing.assert_allclose(
+        result.equity_curve, bt.initial_capital * np.cumprod(1 + expected), rtol=1e-12
+    )
+    assert result.metrics.total_return == pytest.approx(np.prod(1 + expected) - 1, rel=1e-12)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.int8])
+def test_trade_count_ignores_nan_signals(backtest_path, dtype):
+    df = make_ohlcv(300)
+    signals = nan_signals(len(df))
+    if dtype is np.int8:
+        signals = np.nan_to_num(signals).astype(np.int8)
+
+    result = BacktestEngine().run(df, FixedSignalStrategy(signals))
+
+    expected = int((pd.Series(signals).diff().fillna(0) != 0).sum())
+    assert result.metrics.total_trades == expected
+
+
+@pytest.mark.parametrize("price_dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("kind", ["int8", "float", "float_nan"])
+def test_simulate_matches_pandas_baseline(kind, price_dtype):
+    df = make_ohlcv(300)
+    close = df["close"].to_numpy(dtype=price_dtype)
+    signals = nan_signals(len(df))
+    if kind == "int8":
+        signals = np.nan_to_num(signals).astype(np.int8)
+    elif kind == "float":
+        signals = np.nan_to_num(signals)
+
+    returns, equity = _kernels.simulate(close, signals, 0.002, 1e7)
+
+    # float32 종가는 가격 비율 자체를 float32 정밀도(~1e-7)로 계산
+    rtol, atol = (1e-12, 1e-15) if price_dtype is np.float64 else (1e-5, 2e-7)
+    expected = reference_returns(close, signals, 0.002)
+    np.testing.assert_allclose(returns, expected, rtol=rtol, atol=atol)
+    np.testing.assert_allclose(equity, 1e7 * np.cumprod(1 + expected), rtol=rtol)
+
+
+def test_return_stats_matches_pandas():
+    returns = pd.Series(np.random.default_rng(0).normal(0, 0.02, 500))
+
+    total_return, std = _kernels.return_stats(returns.to_numpy())
+
+    assert total_return == pytest.approx((1 + returns).prod() - 1, rel=1e-12)
+    assert std == pytest.approx(returns.std(), rel=1e-12)
+
+
+def test_max_drawdown_matches_accumulate():
+    equity = 1e7 * np.cumprod(1 + np.random.default_rng(1).normal(0, 0.02, 500))
+
+    peak = np.maximum.accumulate(equity)
+    assert _kernels.max_drawdown(equity) == pytest.approx(((equity - peak) / peak).min())
+
+
+def test_trade_stats_matches_masks():
+    returns = np.random.default_rng(2).normal(0, 0.02, 500)
+    returns[::7] = 0.0
+
+    wins, losses, gains, loss_sum = _kernels.trade_stats(returns)
+
+    assert (wins, losses) == (np.sum(returns > 0), np.sum(returns < 0))
+    assert gains == pytest.approx(returns[returns > 0].sum(), rel=1e-12)
+    assert loss_sum == pytest.approx(-returns[returns < 0].sum(), rel=1e-12)
+
+
+def test_calculate_metrics_matches_pandas_baseline(backtest_path):
+    rng = np.random.default_rng(3)
+    returns = pd.Series(rng.normal(0, 0.02, 400))
+    returns[::5] = 0.0
+    returns[:30] = np.nan
+    equity = 1e7 * (1 + returns.fillna(0)).cumprod()
+
+    result = metrics.calculate_metrics(returns.to_numpy(), equity.to_numpy())
+
+    # 리팩터링 전 pandas 계산식
+    valid = returns.dropna()
+    total_return = (1 + valid).prod() - 1
+    annual_return = (1 + total_return) ** (365 / len(valid)) - 1
+    peak = np.maximum.accumulate(equity.to_numpy())
+    wins, losses = valid[valid > 0], valid[valid < 0]
+
+    assert result.total_return == pytest.approx(total_return, rel=1e-12)
+    assert result.sharpe_ratio == pytest.approx(
+        annual_return / (valid.std() * np.sqrt(365)), rel=1e-9
+    )
+    assert result.max_drawdown == pytest.approx(((equity - peak) / peak).min(), rel=1e-12)
+    assert result.win_rate == pytest.approx(len(wins) / (len(wins) + len(losses)))
+    assert result.profit_factor == pytest.approx(wins.sum() / -losses.sum(), rel=1e-12)
+    assert result.avg_trade_return == pytest.approx(valid[valid != 0].mean(), rel=1e-9)
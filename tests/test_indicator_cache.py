@@ -0,0 +1,59 @@
+"""지표 캐시 테스트"""
+
+import numpy as np
+
+from src.indicators import ema, indicator_cache, sma
+from src.indicators.cache import cached
+
+
+def test_hit_returns_same_object(ohlcv):
+    close = ohlcv["close"]
+
+    with indicator_cache():
+        first = ema(close, 20)
+        assert ema(close, 20) is first
+        assert ema(close, period=20) is not first
+        assert ema(close, 10) is not first
+
+
+def test_no_caching_outside_scope(ohlcv):
+    close = ohlcv["close"]
+
+    assert ema(close, 20) is not ema(close, 20)
+
+
+def test_nested_scope_shares_outer_store(ohlcv):
+    close = ohlcv["close"]
+
+    with indicator_cache() as outer:
+        first = sma(close, 5)
+        with indicator_cache() as inner:
+            assert inner is outer
+            assert sma(close, 5) is first
+
+    # 가장 바깥 스코프를 벗어나면 캐시는 버려짐
+    with indicator_cache():
+        assert sma(close, 5) is not first
+
+
+def test_lru_eviction():
+    calls = []
+
+    @cached
+    def scale(data, k):
+        calls.append(k)
+        return data * k
+
+    data = np.arange(3.0)
+    with indicator_cache(maxsize=2) as store:
+        scale(data, 1)
+        scale(data, 2)
+        # 다시 쓴 항목은 최근 순서로 옮겨져, 가장 오래 쓰지 않은 항목(k=2)이 제거됨
+        scale(data, 1)
+        scale(data, 3)
+        assert len(store) == 2
+
+        scale(data, 1)
+        scale(data, 2)
+
+    assert calls == [1, 2, 3, 2]
@@ -0,0 +1,261 @@
+"""기술적 지표 테스트 (JIT 커널 / scipy·bottleneck / NumPy·pandas 경로 일치)"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.indicators import technical
+
+from .conftest import make_ohlcv
+
+
+def close_with_nans(kind: str) -> np.ndarray:
+    """결측 없음 / 앞쪽 결측 / 중간 결측 종가"""
+    close = make_ohlcv(300)["close"].to_numpy(copy=True)
+    if kind == "leading":
+        close[:25] = np.nan
+    elif kind == "interior":
+        close[100:104] = np.nan
+        close[180] = np.nan
+    return close
+
+
+NAN_KINDS = ["clean", "leading", "interior"]
+
+
+def wilder_rsi_reference(close: np.ndarray, period: int) -> np.ndarray:
+    """
+    Wilder RSI 기준 구현 (봉마다 직접 계산)
+
+    변화량이 NaN이면 상승/하락폭 0 (이전 rolling 구현의 where(delta > 0, 0)과 같음).
+    첫 평균은 period개 변화량의 단순평균, 이후는 (이전 * (period-1) + 현재) / period.
+    """
+    n = len(close)
+    out = np.full(n, np.nan)
+    avg_gain = avg_loss = 0.0
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if i < period:
+            avg_gain += gain
+            avg_loss += loss
+            continue
+        if i == period:
+            avg_gain = (avg_gain + gain) / period
+            avg_loss = (avg_loss + loss) / period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        if avg_loss > 0:
+            out[i] = 100 - 100 / (1 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            out[i] = 100.0
+    return out
+
+
+@pytest.fixture(params=["numba", "fallback"])
+def use_numba(request, monkeypatch):
+    """지표를 JIT 커널 경로 또는 대체 경로로 고정"""
+    if request.param == "numba":
+        if not technical.NUMBA_AVAILABLE:
+            pytest.skip("numba 미설치")
+    else:
+        monkeypatch.setattr(technical, "NUMBA_AVAILABLE", False)
+    return request.param == "numba"
+
+
+@pytest.mark.parametrize("kind", NAN_KINDS)
+@pytest.mark.parametrize("period", [2, 14])
+def test_rsi_matches_wilder_reference(use_numba, kind, period):
+    close = close_with_nans(kind)
+
+    result = technical.rsi(close, period)
+
+    np.testing.assert_allclose(result, wilder_rsi_reference(close, period), rtol=1e-10)
+    assert np.isnan(result[:period]).all()
+
+
+@pytest.mark.parametrize("kind", NAN_KINDS)
+def test_rsi_paths_agree(monkeypatch, kind):
+    if not technical.NUMBA_AVAILABLE:
+        pytest.skip("numba 미설치")
+    close = close_with_nans(kind)
+
+    jit = technical.rsi(close, 14)
+    monkeypatch.setattr(technical, "NUMBA_AVAILABLE", False)
+    fallback = technical.rsi(close, 14)
+
+    np.testing.assert_allclose(jit, fallback, rtol=1e-12)
+
+
+def test_rsi_series_input_keeps_index():
+    close = make_ohlcv(50)["close"]
+
+    result = technical.rsi(close, 14)
+
+    assert isinstance(result, pd.Series)
+    assert result.index.equals(close.index)
+    assert ((result.dropna() >= 0) & (result.dropna() <= 100)).all()
+
+
+@pytest.fixture(params=["loop", "lfilter", "pandas"])
+def ema_path(request, monkeypatch):
+    """결측 없는 구간의 EMA 재귀식을 JIT 루프 / scipy lfilter / pandas ewm 중 하나로 고정"""
+    if request.param == "lfilter" and technical.lfilter is None:
+        pytest.skip("scipy 미설치")
+    recursive = {
+        "loop": technical._ema_loop,
+        "lfilter": technical._ema_lfilter,
+        "pandas": None,
+    }[request.param]
+    monkeypatch.setattr(technical, "_ema_recursive", recursive)
+    return request.param
+
+
+@pytest.mark.parametrize("kind", NAN_KINDS)
+@pytest.mark.parametrize("period", [2, 20])
+def test_ema_matches_pandas_ewm(ema_path, kind, period):
+    close = close_with_nans(kind)
+
+    result = technical.ema(close, period)
+
+    expected = pd.Series(close).ewm(span=period, adjust=False).mean().to_numpy()
+    np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+
+def test_ema_lfilter_matches_loop():
+    if technical.lfilter is None:
+        pytest.skip("scipy 미설치")
+    close = close_with_nans("clean")
+
+    for alpha in (2 / 3, 2 / 21, 1 / 14):
+        np.testing.assert_allclose(
+            technical._ema_lfilter(close, alpha), technical._ema_loop(close, alpha), rtol=1e-12
+        )
+    assert len(technical._ema_lfilter(close[:0], 0.5)) == 0
+
+
+def macd_reference(close: np.ndarray, fast: int, slow: int, signal: int) -> tuple:
+    """리팩터링 전 pandas ewm MACD"""
+    close = pd.Series(close)
+    macd_line = (
+        close.ewm(span=fast, adjust=False).mean() - close.ewm(span=slow, adjust=False).mean()
+    )
+    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+    return macd_line, signal_line, macd_line - signal_line
+
+
+@pytest.mark.parametrize("kind", NAN_KINDS)
+def test_macd_matches_pandas_ewm(use_numba, kind):
+    close = close_with_nans(kind)
+
+    result = technical.macd(close, 12, 26, 9)
+
+    for actual, expected in zip(result, macd_reference(close, 12, 26, 9)):
+        np.testing.assert_allclose(actual, expected.to_numpy(), rtol=1e-9, atol=1e-6)
+
+
+@pytest.mark.parametrize("start", [0, 25, 300])
+def test_macd_loop_matches_pandas_ewm(start):
+    close = close_with_nans("clean")
+    close[:start] = np.nan
+    alphas = (2 / 13, 2 / 27, 2 / 10)
+
+    result = technical._macd_loop(close, start, *alphas)
+
+    for actual, expected in zip(result, macd_reference(close, 12, 26, 9)):
+        np.testing.assert_allclose(actual, expected.to_numpy(), rtol=1e-9, atol=1e-6)
+
+
+@pytest.fixture(params=["bottleneck", "numpy"])
+def use_bottleneck(request, monkeypatch):
+    """이동 윈도우 합/평균을 bottleneck 또는 NumPy 누적합 경로로 고정"""
+    if request.param == "bottleneck":
+        if technical.bn is None:
+            pytest.skip("bottleneck 미설치")
+    else:
+        monkeypatch.setattr(technical, "bn", None)
+    return request.param == "bottleneck"
+
+
+@pytest.mark.parametrize("kind", NAN_KINDS)
+@pytest.mark.parametrize("period", [1, 3, 20, 400])
+def test_sma_matches_rolling_mean(use_bottleneck, kind, period):
+    close = close_with_nans(kind)
+
+    result = technical.sma(close, period)
+
+    expected = pd.Series(close).rolling(window=period).mean().to_numpy()
+    np.testing.assert_allclose(result, expected, rtol=1e-9)
+
+
+@pytest.mark.parametrize("kind", NAN_KINDS)
+@pytest.mark.parametrize("period", [2, 20])
+def test_bollinger_matches_rolling_std(use_numba, use_bottleneck, kind, period):
+    close = close_with_nans(kind)
+
+    upper, middle, lower = technical.bollinger_bands(close, period, 2.0)
+
+    rolling = pd.Series(close).rolling(window=period)
+    mean, std = rolling.mean().to_numpy(), rolling.std().to_numpy()
+    np.testing.assert_allclose(middle, mean, rtol=1e-9)
+    np.testing.assert_allclose(upper, mean + 2.0 * std, rtol=1e-9)
+    np.testing.assert_allclose(lower, mean - 2.0 * std, rtol=1e-9)
+
+
+@pytest.mark.parametrize("period", [1, 2, 20, 400])
+def test_rolling_mean_std_kernel_matches_pandas(period):
+    close = close_with_nans("interior")
+
+    mean, std = technical._rolling_mean_std(close, period)
+
+    rolling = pd.Series(close).rolling(window=period)
+    np.testing.assert_allclose(mean, rolling.mean().to_numpy(), rtol=1e-9)
+    np.testing.assert_allclose(std, rolling.std().to_numpy(), rtol=1e-9)
+
+
+def ohlcv_with_nans(kind: str) -> pd.DataFrame:
+    """종가/거래량에 결측을 넣은 OHLCV"""
+    df = make_ohlcv(300)
+    close = close_with_nans(kind)
+    return df.assign(close=close, volume=np.where(np.isnan(close), np.nan, df["volume"]))
+
+
+@pytest.mark.parametrize("kind", NAN_KINDS)
+@pytest.mark.parametrize("period", [1, 5, 20, 400])
+def test_rolling_sum_matches_pandas(use_bottleneck, kind, period):
+    close = close_with_nans(kind)
+
+    result = technical._rolling_sum(close, period)
+
+    expected = pd.Series(close).rolling(window=period).sum().to_numpy()
+    np.testing.assert_allclose(result, expected, rtol=1e-9)
+
+
+@pytest.mark.parametrize("kind", NAN_KINDS)
+def test_vwap_rolling_matches_pandas(use_bottleneck, kind):
+    df = ohlcv_with_nans(kind)
+
+    result = technical.vwap_rolling(df, 20)
+
+    # 리팩터링 전 pandas 계산식
+    pv = (df["high"] + df["low"] + df["close"]) / 3 * df["volume"]
+    expected = pv.rolling(window=20).sum() / df["volume"].rolling(window=20).sum()
+    pd.testing.assert_series_equal(result, expected, rtol=1e-9, check_names=False)
+
+
+@pytest.mark.parametrize("kind", NAN_KINDS)
+def test_vwap_matches_pandas_cumsum(kind):
+    df = ohlcv_with_nans(kind)
+
+    result = technical.vwap(df)
+
+    # 리팩터링 전 pandas 계산식 (cumsum은 결측을 건너뛰고 그 위치만 NaN)
+    typical_price = (df["high"] + df["low"] + df["close"]) / 3
+    expected = (typical_price * df["volume"]).cumsum() / df["volume"].cumsum()
+    pd.testing.assert_series_equal(result, expected, rtol=1e-12, check_names=False)
+
+
+def test_cumsum_skipna_empty():
+    assert len(technical._cumsum_skipna(np.array([]))) == 0
@@ -0,0 +1,89 @@
+"""OHLCV 디스크 캐시 테스트"""
+
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from src.exchanges import _cache
+from src.exchanges.upbit import UpbitExchange
+
+from .conftest import make_ohlcv
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(_cache, "CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+def _expire(cache_dir):
+    """캐시 파일을 MAX_AGE보다 오래된 것으로 표시"""
+    old = time.time() - _cache.MAX_AGE - 60
+    for path in cache_dir.iterdir():
+        os.utime(path, (old, old))
+
+
+def test_merge_tail_matches_concat():
+    data = make_ohlcv(50)
+    cached = data.iloc[:40]
+    # 캐시 마지막 봉(미완성)이 갱신된 tail
+    tail = data.iloc[39:].copy()
+    tail.iloc[0, tail.columns.get_loc("close")] += 1.0
+
+    expected = pd.concat([cached.iloc[:39], tail])
+    pd.testing.assert_frame_equal(_cache.merge_tail(cached, tail), expected, check_freq=False)
+
+
+def test_merge_tail_mixed_dtypes_falls_back_to_concat():
+    data = make_ohlcv(50).astype({"volume": "float32"})
+
+    merged = _cache.merge_tail(data.iloc[:40], data.iloc[30:])
+
+    pd.testing.assert_frame_equal(merged, data, check_freq=False)
+
+
+def test_fresh_cache_skips_api(cache_dir, fake_pyupbit):
+    pytest.importorskip("pyarrow")
+    exchange = UpbitExchange()
+
+    first = exchange.get_ohlcv_cached("BTC", "1d", limit=150)
+    calls = len(fake_pyupbit.calls)
+    second = exchange.get_ohlcv_cached("BTC", "1d", limit=100)
+
+    assert len(fake_pyupbit.calls) == calls
+    pd.testing.assert_frame_equal(second, first.iloc[-100:], check_freq=False)
+
+
+def test_stale_cache_refreshes_tail(cache_dir, fake_pyupbit):
+    pytest.importorskip("pyarrow")
+    exchange = UpbitExchange()
+
+    # 캐시 저장 후 새 봉 3개가 생기고 마지막 봉 종가가 바뀐 상황
+    full = fake_pyupbit.data
+    fake_pyupbit.data = full.iloc[:-3]
+    exchange.get_ohlcv_cached("BTC", "1d", limit=300)
+    _expire(cache_dir)
+    fake_pyupbit.data = full
+    fake_pyupbit.calls.clear()
+
+    df = exchange.get_ohlcv_cached("BTC", "1d", limit=300)
+
+    assert [call[2] for call in fake_pyupbit.calls] == [200]
+    pd.testing.assert_frame_equal(df, full.iloc[-300:], check_freq=False)
+    pd.testing.assert_frame_equal(
+        _cache.load_cached("upbit", "KRW-BTC", "day"), full.iloc[-303:], check_freq=False
+    )
+
+
+def test_longer_limit_refetches(cache_dir, fake_pyupbit):
+    pytest.importorskip("pyarrow")
+    exchange = UpbitExchange()
+
+    exchange.get_ohlcv_cached("BTC", "1d", limit=100)
+    fake_pyupbit.calls.clear()
+    df = exchange.get_ohlcv_cached("BTC", "1d", limit=250)
+
+    assert fake_pyupbit.calls
+    pd.testing.assert_frame_equal(df, fake_pyupbit.data.iloc[-250:], check_freq=False)
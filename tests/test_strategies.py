@@ -0,0 +1,84 @@
+"""전략 인터페이스 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest import BacktestEngine
+from src.strategies import BaseStrategy, EMACrossStrategy, IndicatorStrategy
+
+
+class CloseRising(BaseStrategy):
+    """calculate만 구현한 전략"""
+
+    def __init__(self, threshold: float = 0.0):
+        self.threshold = threshold
+
+    @property
+    def name(self) -> str:
+        return "close_rising"
+
+    @property
+    def params(self) -> dict:
+        return {"threshold": self.threshold}
+
+    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
+        signal = (df["close"].diff() > self.threshold).astype(np.int8)
+        return pd.DataFrame({"signal": signal}, index=df.index)
+
+
+def test_base_strategy_requires_calculate():
+    class NoCalculate(BaseStrategy):
+        name = "none"
+
+    with pytest.raises(TypeError):
+        NoCalculate()
+
+
+def test_indicator_strategy_requires_both_stages():
+    class IndicatorsOnly(IndicatorStrategy):
+        name = "indicators_only"
+
+        def compute_indicators(self, df):
+            return {}
+
+    with pytest.raises(TypeError):
+        IndicatorsOnly()
+
+
+def test_indicator_strategy_calculate_runs_both_stages(ohlcv):
+    strategy = EMACrossStrategy(short_period=3, long_period=10)
+
+    result = strategy.calculate(ohlcv)
+
+    indicators = strategy.compute_indicators(ohlcv)
+    assert set(result.columns) == {*indicators, "signal"}
+    np.testing.assert_array_equal(
+        result["signal"].to_numpy(), strategy.generate_signals(ohlcv, indicators)
+    )
+
+
+def test_grid_search_runs_calculate_only_strategy(ohlcv):
+    results = BacktestEngine().grid_search(ohlcv, CloseRising, {"threshold": [0.0, 1e5]})
+
+    assert len(results) == 2
+    assert sorted(results["threshold"]) == [0.0, 1e5]
+
+
+def test_ema_cross_signal_builder_follows_filter_flags(ohlcv):
+    # bool이 아닌 참/거짓 값도 허용
+    strategy = EMACrossStrategy(
+        short_period=3, long_period=10, use_trend_filter=1, use_rsi_filter=0
+    )
+    assert strategy.params["use_trend_filter"] is True
+
+    indicators = EMACrossStrategy(short_period=3, long_period=10).compute_indicators(ohlcv)
+    trend_only = strategy.generate_signals(ohlcv, indicators)
+
+    # 생성 후 필터를 바꾸면 신호 생성 경로도 바뀜
+    strategy.use_rsi_filter = True
+    both = strategy.generate_signals(ohlcv, indicators)
+    expected = EMACrossStrategy(short_period=3, long_period=10).generate_signals(ohlcv, indicators)
+
+    np.testing.assert_array_equal(both, expected)
+    assert (trend_only != both).any()
@@ -0,0 +1,131 @@
+"""업비트 OHLCV 페이지 수집 테스트"""
+
+import pandas as pd
+import pytest
+
+from src.exchanges.upbit import UpbitExchange, _OHLCVBuffer
+
+from .conftest import make_ohlcv
+
+
+def test_buffer_trims_overlapping_pages():
+    data = make_ohlcv(30)
+    buffer = _OHLCVBuffer(25)
+
+    # 최신 페이지부터 과거 방향으로, 앞 페이지와 봉이 겹치게 추가
+    buffer.prepend(data.iloc[20:])
+    buffer.prepend(data.iloc[12:22])
+    buffer.prepend(data.iloc[5:13])
+
+    df = buffer.to_dataframe()
+    assert len(buffer) == 25
+    assert df.index.is_unique
+    assert df.index.is_monotonic_increasing
+    pd.testing.assert_frame_equal(df, data.iloc[5:], check_freq=False)
+
+
+def test_buffer_fills_pages_back_to_front():
+    data = make_ohlcv(30)
+    buffer = _OHLCVBuffer(30)
+
+    # 최신 페이지부터 과거 방향으로 추가
+    buffer.prepend(data.iloc[20:])
+    buffer.prepend(data.iloc[10:20])
+    buffer.prepend(data.iloc[:10])
+
+    assert len(buffer) == 30
+    pd.testing.assert_frame_equal(buffer.to_dataframe(), data, check_freq=False)
+
+
+def test_buffer_grows_past_initial_size():
+    data = make_ohlcv(30)
+    buffer = _OHLCVBuffer(10)
+
+    buffer.prepend(data.iloc[15:])
+    buffer.prepend(data.iloc[:15])
+
+    pd.testing.assert_frame_equal(buffer.to_dataframe(), data, check_freq=False)
+
+
+def test_empty_buffer():
+    assert _OHLCVBuffer(5).to_dataframe().empty
+
+
+def test_buffer_limit_keeps_most_recent_bars():
+    data = make_ohlcv(30)
+    buffer = _OHLCVBuffer(15)
+
+    buffer.prepend(data.iloc[20:])
+    buffer.prepend(data.iloc[:21], limit=5)
+
+    pd.testing.assert_frame_equal(buffer.to_dataframe(), data.iloc[15:], check_freq=False)
+
+
+@pytest.mark.parametrize("inclusive", [False, True])
+@pytest.mark.parametrize("gaps", [False, True])
+def test_get_ohlcv_sync_pages_long_history(fake_pyupbit, inclusive, gaps):
+    fake_pyupbit.inclusive = inclusive
+    if gaps:
+        # 거래 없는 봉이 빠진 구간 (페이지 경계 계산이 어긋나 페이지가 겹침)
+        fake_pyupbit.data = fake_pyupbit.data.iloc[fake_pyupbit.data.index.day != 7]
+
+    df = UpbitExchange().get_ohlcv_sync("BTC", "1d", limit=450)
+
+    assert len(df) == 450
+    assert df.index.is_unique
+    assert df.index.is_monotonic_increasing
+    pd.testing.assert_frame_equal(df, fake_pyupbit.data.iloc[-450:], check_freq=False)
+    assert {call[:2] for call in fake_pyupbit.calls} == {("KRW-BTC", "day")}
+
+
+@pytest.mark.parametrize("inclusive", [False, True])
+async def test_get_ohlcv_pages_long_history(fake_pyupbit, inclusive):
+    fake_pyupbit.inclusive = inclusive
+
+    # 이벤트 루프 안에서는 동기 경로도 순차 페이지 수집을 사용
+    assert len(UpbitExchange().get_ohlcv_sync("BTC", "1d", limit=450)) == 450
+
+    df = await UpbitExchange().get_ohlcv("BTC/KRW", "1d", limit=450)
+
+    pd.testing.assert_frame_equal(df, fake_pyupbit.data.iloc[-450:], check_freq=False)
+
+
+async def test_get_ohlcv_stops_at_listing_date(fake_pyupbit):
+    df = await UpbitExchange().get_ohlcv("BTC", "1d", limit=1200)
+
+    pd.testing.assert_frame_equal(df, fake_pyupbit.data, check_freq=False)
+
+
+def test_get_ohlcv_sync_stops_at_listing_date(fake_pyupbit):
+    df = UpbitExchange().get_ohlcv_sync("BTC", "1d", limit=1200)
+
+    pd.testing.assert_frame_equal(df, fake_pyupbit.data, check_freq=False)
+
+
+async def test_normalized_arguments_are_memoized_per_instance(fake_pyupbit):
+    calls = []
+
+    class CountingUpbit(UpbitExchange):
+        def _normalize_symbol(self, symbol):
+            calls.append(symbol)
+            return "KRW-ETH"
+
+    exchange = CountingUpbit()
+    for _ in range(3):
+        await exchange.get_ohlcv("BTC", "1d", limit=10)
+        exchange.get_ohlcv_sync("BTC", "1d", limit=10)
+
+    # 오버라이드한 정규화 결과를 조합마다 한 번만 계산해 모든 조회에 사용
+    assert calls == ["BTC"]
+    assert {call[0] for call in fake_pyupbit.calls} == {"KRW-ETH"}
+    assert UpbitExchange()._normalize_pair("BTC", "1h") == ("KRW-BTC", "minute60")
+
+
+async def test_get_tickers_unwraps_single_price(fake_pyupbit):
+    exchange = UpbitExchange()
+
+    assert await exchange.get_tickers(["BTC", "KRW-BTC"]) == {"KRW-BTC": 1.0}
+    assert await exchange.get_tickers(["BTC", "ETH"]) == {"KRW-BTC": 1.0, "KRW-ETH": 1.0}
+
+    fake_pyupbit.get_current_price = lambda ticker: None
+    assert await exchange.get_tickers(["BTC"]) == {}